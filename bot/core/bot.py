@@ -3,7 +3,6 @@ from __future__ import annotations
 
 # Standard Library
 import collections
-import copy
 import logging
 import re
 import time
@@ -22,15 +21,18 @@ import topgg
 from discord.ext import commands, ipc
 # noinspection PyUnresolvedReferences
 from discord.ext.alternatives import converter_dict
+from discord.ext.commands.view import StringView
 from slate import obsidian
 
 # My stuff
 from core import config, values
-from utilities import checks, custom, enums, managers, utils
+from utilities import checks, custom, enums, imaging, managers, renderers, utils, workers
 
 
 __log__: logging.Logger = logging.getLogger("bot")
 
+FLAG_REGEX: re.Pattern[str] = re.compile(r"--([^\s]+)\s*")
+
 
 class Life(commands.AutoShardedBot):
 
@@ -73,6 +75,24 @@ class Life(commands.AutoShardedBot):
 
         self.user_manager: managers.UserManager = managers.UserManager(bot=self)
         self.guild_manager: managers.GuildManager = managers.GuildManager(bot=self)
+        self.member_manager: managers.MemberManager = managers.MemberManager(bot=self)
+        self.rank_manager: managers.RankManager = managers.RankManager(bot=self)
+        self.avatar_manager: managers.AvatarManager = managers.AvatarManager(bot=self)
+
+        self.render_pool: workers.WorkerPool = workers.WorkerPool(
+            name="render",
+            max_workers=values.RENDER_WORKERS,
+            timeout=values.RENDER_TIMEOUT,
+            initializer=renderers.initialise,
+        )
+        self.image_pool: workers.WorkerPool = workers.WorkerPool(
+            name="image",
+            max_workers=values.IMAGE_WORKERS,
+            timeout=values.IMAGE_TIMEOUT,
+            initializer=imaging.initialise,
+            max_jobs=values.IMAGE_WORKER_MAX_JOBS,
+            max_memory=values.IMAGE_WORKER_MAX_MEMORY,
+        )
 
         self.first_ready: bool = True
         self.start_time: float = time.time()
@@ -83,7 +103,19 @@ class Life(commands.AutoShardedBot):
 
     #
 
-    async def get_prefix(self, message: discord.Message) -> list[str]:
+    async def get_prefix(self, message: discord.Message) -> list[str] | str:
+
+        if not message.guild:
+            return commands.when_mentioned_or(config.PREFIX, "I-", "")(self, message)
+
+        guild_config = await self.guild_manager.get_config(message.guild.id)
+
+        if match := guild_config.prefix_pattern.match(message.content):
+            return match.group()
+
+        return []
+
+    async def get_prefixes(self, message: discord.Message) -> list[str]:
 
         if not message.guild:
             return commands.when_mentioned_or(config.PREFIX, "I-", "")(self, message)
@@ -100,18 +132,19 @@ class Life(commands.AutoShardedBot):
 
         if ctx.command and ctx.command.name in values.FLAG_COMMANDS and ctx.invoked_with:
 
-            content = message.content
-            start = content.index(ctx.invoked_with) + len(ctx.invoked_with) + 1
-            try:
-                end = content.index(" --")
-            except ValueError:
+            # Quote everything before the first flag so it is parsed as one argument and give every flag an explicit
+            # value, then swap the rewritten arguments into the existing context's view instead of building a second
+            # context from a copied message.
+            content = ctx.view.buffer
+            start = ctx.view.index + 1
+
+            if (end := content.find(" --", start)) == -1:
                 end = len(content)
 
-            new_message = copy.copy(message)
-            new_content = (content[:start] + ('"' + content[start:end] + '"') + content[end:]).replace('""', "")
-            new_message.content = re.sub(r"--([^\s]+)\s*", r"--\1 true ", new_content)
+            arguments = ('"' + content[start:end] + '"' + content[end:]).replace('""', "")
 
-            ctx = await self.get_context(new_message)
+            ctx.view = StringView(content[:start] + FLAG_REGEX.sub(r"--\1 true ", arguments))
+            ctx.view.index = ctx.view.previous = start - 1
 
         await self.invoke(ctx)
 
@@ -134,6 +167,12 @@ class Life(commands.AutoShardedBot):
         else:
             __log__.info("[POSTGRESQL] Successful connection.")
             self.db = db
+            self.member_manager.start()
+
+        await self.user_manager.load_blacklist()
+        await self.guild_manager.preload()
+        await self.render_pool.start()
+        await self.image_pool.start()
 
         try:
             __log__.debug("[REDIS] Attempting connection.")
@@ -162,8 +201,11 @@ class Life(commands.AutoShardedBot):
     async def close(self) -> None:
 
         await self.session.close()
+        self.render_pool.shutdown()
+        self.image_pool.shutdown()
 
         if self.db:
+            await self.member_manager.stop()
             await self.db.close()
         if self.redis:
             await self.redis.close()
@@ -174,10 +216,11 @@ class Life(commands.AutoShardedBot):
 
     async def on_ready(self) -> None:
 
+        self.scheduler.start()
+
         if self.first_ready is True:
             self.first_ready = False
-
-        self.scheduler.start()
+            await self.user_manager.schedule_reminders()
 
         await self.cogs["Voice"].load()  # type: ignore
 
@@ -1,6 +1,10 @@
 # Future
 from __future__ import annotations
 
+# Standard Library
+import os
+import pathlib
+
 # Packages
 import discord
 from pendulum.tz.timezone import Timezone
@@ -60,6 +64,25 @@ FLAG_COMMANDS = [
     "rolecounts",
 ]
 
+# Use REDIS when running more than one process so that xp cooldowns are shared between them.
+XP_COOLDOWN_BACKEND = enums.CooldownBackend.MEMORY
+
+# Processes used to render level cards, leaderboards and the timecard/birthday grids, and how long a render may take.
+RENDER_WORKERS: int = max((os.cpu_count() or 2) // 2, 1)
+RENDER_TIMEOUT: float = 30
+
+# Processes used to run image effects, how long an effect may take, and how many effects or how much memory (in bytes)
+# a worker may use before the workers are replaced with fresh ones.
+IMAGE_WORKERS: int = max((os.cpu_count() or 2) // 2, 1)
+IMAGE_TIMEOUT: float = 60
+IMAGE_WORKER_MAX_JOBS: int = 100
+IMAGE_WORKER_MAX_MEMORY: int = (2 ** 20) * 512
+
+# Directory to keep fetched avatars in between restarts, or None to only cache them in memory, and how large (in bytes)
+# it may grow before the least recently used avatars are deleted.
+AVATAR_DISK_CACHE_PATH: pathlib.Path | None = None
+AVATAR_DISK_CACHE_MAX_BYTES: int = (2 ** 20) * 512
+
 CONVERTERS = {
     objects.PastPhrasedDatetimeSearch:   converters.PastPhrasedDatetimeConverter,
     objects.FuturePhrasedDatetimeSearch: converters.FuturePhrasedDatetimeConverter,
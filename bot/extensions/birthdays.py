@@ -219,8 +219,8 @@ class Birthdays(commands.Cog):
         """
 
         async with ctx.typing():
-            file = await self.bot.user_manager.create_birthday_card(guild_id=ctx.guild.id)
-            await ctx.reply(file=file)
+            files = await self.bot.user_manager.create_birthday_card(guild_id=ctx.guild.id)
+            await ctx.reply(files=files)
 
     # Aliases
 
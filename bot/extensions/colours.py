@@ -2,19 +2,17 @@
 from __future__ import annotations
 
 # Standard Library
-import io
-import os
-from typing import Any, Literal, Optional
+from typing import Literal, Optional
 
 # Packages
 import discord
 from discord.ext import commands
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
 # My stuff
 from core import colours, emojis
 from core.bot import Life
-from utilities import custom, decorators, exceptions, utils
+from utilities import custom, decorators, encoders, exceptions, fonts, utils
 
 
 def setup(bot: Life) -> None:
@@ -22,7 +20,6 @@ def setup(bot: Life) -> None:
 
 
 Modes = Literal["monochrome", "monochrome-dark", "monochrome-light", "analogic", "complement", "analogic-complement", "triad", "quad"]
-KABEL_BLACK_FONT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../resources/fonts/kabel_black.otf"))
 
 
 class Colours(commands.Cog):
@@ -31,38 +28,30 @@ class Colours(commands.Cog):
         self.bot = bot
 
     @decorators.async_executor
-    def generate_colour_square(self, colour: str) -> Any:
+    def generate_colour_square(self, colour: str) -> tuple[bytes, str]:
 
         with Image.new(mode="RGBA", size=(256, 100), color=colour) as image:
-
-            buffer = io.BytesIO()
-            image.save(buffer, "png")
-
-        buffer.seek(0)
-        return buffer
+            return encoders.COLOUR_SQUARE.encode(image)
 
     # noinspection PyTypeChecker
     @decorators.async_executor
-    def generate_colour_scheme(self, hex_codes: list[str], names: list[str]) -> Any:
+    def generate_colour_scheme(self, hex_codes: list[str], names: list[str]) -> tuple[bytes, str]:
 
         with Image.new(mode="RGBA", size=(200 * len(hex_codes), 225), color="white") as image:
 
             draw = ImageDraw.Draw(im=image)
+            font = fonts.font(fonts.KABEL_BLACK, 20)
             x = 0
 
             for hex_code, name in zip(hex_codes, names):
 
                 draw.rectangle(xy=((x, 25), (x + 200, 225)), fill=hex_code)
-                draw.text(xy=(x + 5, 5), text=name, font=ImageFont.truetype(font=KABEL_BLACK_FONT, size=20), fill="#1F1E1C")
-                draw.text(xy=(x + 5, 30), text=hex_code, font=ImageFont.truetype(font=KABEL_BLACK_FONT, size=20), fill="#1F1E1C")
+                draw.text(xy=(x + 5, 5), text=name, font=font, fill="#1F1E1C")
+                draw.text(xy=(x + 5, 30), text=hex_code, font=font, fill="#1F1E1C")
 
                 x += 200
 
-            buffer = io.BytesIO()
-            image.save(buffer, "png")
-
-        buffer.seek(0)
-        return buffer
+            return encoders.COLOUR_SCHEME.encode(image)
 
     @commands.command(name="randomcolour", aliases=["random-colour", "random_colour", "randomcolor", "random-color", "random_color", "rc"])
     async def randomcolour(self, ctx: custom.Context) -> None:
@@ -90,9 +79,8 @@ class Colours(commands.Cog):
             name_is_exact_match = data["name"]["exact_match_name"]
             name_exact_match_hex = data["name"]["closest_named_hex"]
 
-        buffer = await self.generate_colour_square(hex)
-        url = await utils.upload_file(session=self.bot.session, file_bytes=buffer, file_format="png")
-        buffer.close()
+        image, file_format = await self.generate_colour_square(hex)
+        url = await utils.upload_file(session=self.bot.session, file_bytes=image, file_format=file_format)
 
         embed = discord.Embed(
             title=f"{name} - {hex}",
@@ -146,9 +134,8 @@ class Colours(commands.Cog):
             hex_codes = [colour["hex"]["value"] for colour in data["colors"]]
             names = [colour["name"]["value"] for colour in data["colors"]]
 
-        buffer = await self.generate_colour_scheme(hex_codes, names)
-        url = await utils.upload_file(session=self.bot.session, file_bytes=buffer, file_format="png")
-        buffer.close()
+        image, file_format = await self.generate_colour_scheme(hex_codes, names)
+        url = await utils.upload_file(session=self.bot.session, file_bytes=image, file_format=file_format)
 
         embed = discord.Embed(
             description=f"**Base:** {seed}\n"
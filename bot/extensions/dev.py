@@ -7,6 +7,7 @@ import time
 
 # Packages
 import discord
+import humanize
 from discord.ext import commands
 
 # My stuff
@@ -121,6 +122,67 @@ class Dev(commands.Cog):
             codeblock=True
         )
 
+    @commands.is_owner()
+    @dev.command(name="caches", aliases=["cache"], hidden=True)
+    async def dev_caches(self, ctx: custom.Context) -> None:
+        """
+        Displays size, hit, miss and eviction counts for the bots caches.
+        """
+
+        caches = [
+            self.bot.user_manager.cache,
+            self.bot.guild_manager.cache,
+            self.bot.rank_manager.cache,
+            self.bot.user_manager.leaderboard_pages,
+            self.bot.user_manager.leaderboard_cursors,
+            self.bot.user_manager.member_counts,
+            self.bot.user_manager.level_cards,
+            self.bot.avatar_manager.cache,
+            self.bot.avatar_manager.users,
+        ]
+
+        await ctx.paginate(
+            entries=[
+                f"║ {cache.name:12} ║ {len(cache):<8} ║ {humanize.naturalsize(cache.bytes):10} ║ {cache.stats.hits:<10} ║ {cache.stats.misses:<10} ║ "
+                f"{f'{round(cache.stats.hit_rate * 100, 2)}%':8} ║ {cache.stats.evictions + cache.stats.expirations:<9} ║"
+                for cache in caches
+            ],
+            per_page=20,
+            header="╔══════════════╦══════════╦════════════╦════════════╦════════════╦══════════╦═══════════╗\n"
+                   "║ Cache        ║ Size     ║ Memory     ║ Hits       ║ Misses     ║ Hit rate ║ Evictions ║\n"
+                   "╠══════════════╬══════════╬════════════╬════════════╬════════════╬══════════╬═══════════╣\n",
+            footer="\n"
+                   "╚══════════════╩══════════╩════════════╩════════════╩════════════╩══════════╩═══════════╝",
+            codeblock=True
+        )
+
+    @commands.is_owner()
+    @dev.command(name="workers", aliases=["pools"], hidden=True)
+    async def dev_workers(self, ctx: custom.Context) -> None:
+        """
+        Displays queue depth, job counts, restarts and timings for the bots worker pools.
+        """
+
+        pools = [
+            self.bot.render_pool,
+            self.bot.image_pool,
+        ]
+
+        await ctx.paginate(
+            entries=[
+                f"║ {pool.name:8} ║ {pool.max_workers:<7} ║ {pool.stats.pending:<7} ║ {pool.queue_depth:<7} ║ {pool.stats.completed:<9} ║ {pool.stats.failed:<7} ║ "
+                f"{pool.stats.timed_out:<9} ║ {pool.stats.restarts:<8} ║ {f'{round(pool.stats.average_time * 1000, 2)}ms':10} ║"
+                for pool in pools
+            ],
+            per_page=20,
+            header="╔══════════╦═════════╦═════════╦═════════╦═══════════╦═════════╦═══════════╦══════════╦════════════╗\n"
+                   "║ Pool     ║ Workers ║ Pending ║ Queued  ║ Completed ║ Failed  ║ Timed out ║ Restarts ║ Avg time   ║\n"
+                   "╠══════════╬═════════╬═════════╬═════════╬═══════════╬═════════╬═══════════╬══════════╬════════════╣\n",
+            footer="\n"
+                   "╚══════════╩═════════╩═════════╩═════════╩═══════════╩═════════╩═══════════╩══════════╩════════════╝",
+            codeblock=True
+        )
+
     @commands.is_owner()
     @commands.group(name="blacklist", aliases=["bl"], hidden=True, invoke_without_command=True)
     async def blacklist(self, ctx: custom.Context) -> None:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 # Standard Library
+import asyncio
 import functools
 import random
 
@@ -10,9 +11,9 @@ import discord
 from discord.ext import commands
 
 # My stuff
-from core import colours, emojis
+from core import values
 from core.bot import Life
-from utilities import custom, enums, exceptions, utils
+from utilities import custom, enums, managers, utils
 
 
 def setup(bot: Life) -> None:
@@ -24,6 +25,15 @@ class Economy(commands.Cog):
     def __init__(self, bot: Life) -> None:
         self.bot = bot
 
+        self.xp_cooldowns: managers.CooldownManager | managers.RedisCooldownManager
+
+        # The bot connects to redis before loading extensions, but the cog can be loaded without it (e.g. in a test bot),
+        # in which case cooldowns are kept in memory.
+        if values.XP_COOLDOWN_BACKEND is enums.CooldownBackend.REDIS and self.bot.redis is not None:
+            self.xp_cooldowns = managers.RedisCooldownManager(name="xp_gain", per=60, redis=self.bot.redis)
+        else:
+            self.xp_cooldowns = managers.CooldownManager(name="xp_gain", per=60)
+
     # Events
 
     @commands.Cog.listener()
@@ -32,7 +42,7 @@ class Economy(commands.Cog):
         if message.guild is None or message.author.bot is True:
             return
 
-        if bool(await self.bot.redis.exists(f"{message.author.id}_{message.guild.id}_xp_gain")) is True:
+        if await self.xp_cooldowns.try_acquire(message.author.id, message.guild.id) is False:
             return
 
         user_config = await self.bot.user_manager.get_config(message.author.id)
@@ -41,11 +51,9 @@ class Economy(commands.Cog):
         xp = random.randint(10, 25)
         await member_config.change_xp(xp, operation=enums.Operation.ADD)
 
-        if xp >= member_config.needed_xp and user_config.notifications.level_ups:
+        if xp >= member_config.needed_xp and (await user_config.get_notifications()).level_ups:
             await message.reply(f"You are now level `{member_config.level}`!")
 
-        await self.bot.redis.setex(name=f"{message.author.id}_{message.guild.id}_xp_gain", time=60, value="")
-
     #
 
     @commands.command(name="level", aliases=["xp", "score", "rank"], ignore_extra=False)
@@ -59,11 +67,7 @@ class Economy(commands.Cog):
         user = person or ctx.author
 
         async with ctx.typing():
-            buffer = await self.bot.user_manager.create_level_card(guild_id=ctx.guild.id, user_id=user.id)
-            url = await utils.upload_file(self.bot.session, file_bytes=buffer, file_format="png")
-            buffer.close()
-
-            await ctx.reply(url)
+            await ctx.reply(await self.bot.user_manager.level_card_url(guild_id=ctx.guild.id, user_id=user.id))
 
     @commands.group(name="leaderboard", aliases=["lb"], invoke_without_command=True)
     async def leaderboard(self, ctx: custom.Context) -> None:
@@ -71,7 +75,7 @@ class Economy(commands.Cog):
         Displays the leaderboard for ranks, xp and levels.
         """
 
-        pages = ((await self.bot.db.fetchrow("SELECT count(*) FROM members WHERE guild_id = $1", ctx.guild.id))["count"] // 10) + 1
+        pages = (await self.bot.user_manager.member_count(ctx.guild.id) // 10) + 1
         await ctx.paginate_file(
             entries=[functools.partial(self.bot.user_manager.create_leaderboard, guild_id=ctx.guild.id, page=page + 1) for page in range(pages)]
         )
@@ -82,29 +86,19 @@ class Economy(commands.Cog):
         Displays the leaderboard in a text table.
         """
 
-        leaderboard = await self.bot.user_manager.leaderboard(guild_id=ctx.guild.id, page=0, limit=None)
-        if not (member_config := discord.utils.find(lambda r: r['user_id'] == ctx.author.id, leaderboard)):
-            raise exceptions.EmbedError(
-                colour=colours.RED,
-                emoji=emojis.CROSS,
-                description="Something went wrong while fetching the leaderboard."
-            )
-
-        entries = []
-
-        for record in leaderboard:
+        user_config = await self.bot.user_manager.get_config(ctx.author.id)
+        member_config = await user_config.get_member_config(ctx.guild.id)
 
-            if not (member := ctx.guild.get_member(record["user_id"])):
-                continue
+        # Buffered xp has to be written first for the count of members ahead to be right.
+        await self.bot.member_manager.flush()
 
-            entries.append(f"║ {record['rank']:<5} ║ {record['xp']:<9} ║ {utils.level(record['xp']):<5} ║ {member.nick or member.name:<37} ║")
+        rank = await self.bot.user_manager.leaderboard_rank(ctx.guild.id, user_id=ctx.author.id, xp=member_config.xp)
+        pages = (await self.bot.user_manager.member_count(ctx.guild.id) // 10) + 1
 
-        author_stats = f"║ {await self.bot.user_manager.rank(guild_id=ctx.guild.id, user_id=ctx.author.id):<5} ║ {member_config['xp']:<9} " \
-                       f"║ {utils.level(member_config['xp']):<5} ║ {ctx.author.nick or ctx.author.name:<37} ║\n"
+        author_stats = f"║ {rank:<5} ║ {member_config.xp:<9} ║ {member_config.level:<5} ║ {ctx.author.nick or ctx.author.name:<37} ║\n"
 
-        await ctx.paginate(
-            entries=entries,
-            per_page=10,
+        await ctx.paginate_lazy_text(
+            entries=[functools.partial(self._leaderboard_text_page, guild=ctx.guild, page=page + 1) for page in range(pages)],
             header="╔═══════╦═══════════╦═══════╦═══════════════════════════════════════╗\n"
                    "║ Rank  ║ XP        ║ Level ║ Name                                  ║\n"
                    "╠═══════╬═══════════╬═══════╬═══════════════════════════════════════╣\n",
@@ -115,3 +109,20 @@ class Economy(commands.Cog):
                    f"╚═══════╩═══════════╩═══════╩═══════════════════════════════════════╝\n",
             codeblock=True
         )
+
+    async def _leaderboard_text_page(self, *, guild: discord.Guild, page: int) -> str:
+
+        records = await self.bot.user_manager.leaderboard(guild_id=guild.id, page=page)
+
+        # People who have left the guild are kept in, under their (cached) user from the API, so that every page has as
+        # many rows as the member count it was sized by.
+        missing = [record["user_id"] for record in records if guild.get_member(record["user_id"]) is None]
+        users = dict(zip(missing, await asyncio.gather(*(self.bot.avatar_manager.get_user(user_id) for user_id in missing))))
+
+        entries = []
+
+        for record in records:
+            person = guild.get_member(record["user_id"]) or users[record["user_id"]]
+            entries.append(f"║ {record['rank']:<5} ║ {record['xp']:<9} ║ {utils.level(record['xp']):<5} ║ {getattr(person, 'nick', None) or person.name:<37} ║")
+
+        return "\n".join(entries)
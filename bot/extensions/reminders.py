@@ -75,7 +75,7 @@ class Reminders(commands.Cog):
 
         user_config = await self.bot.user_manager.get_config(ctx.author.id)
 
-        if not (reminders := [reminder for reminder in user_config.reminders.values() if not reminder.done]):
+        if not (reminders := [reminder for reminder in (await user_config.get_reminders()).values() if not reminder.done]):
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 emoji=emojis.CROSS,
@@ -112,7 +112,7 @@ class Reminders(commands.Cog):
 
         user_config = await self.bot.user_manager.get_config(ctx.author.id)
 
-        if not user_config.reminders:
+        if not (reminders := await user_config.get_reminders()):
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 emoji=emojis.CROSS,
@@ -125,7 +125,7 @@ class Reminders(commands.Cog):
             f"**When:** {utils.format_datetime(reminder.datetime, seconds=True)}\n"
             f"**Repeat:** {reminder.repeat_type.name.replace('_', ' ').lower().title()}\n"
             f"**Content:** {await utils.safe_content(self.bot.mystbin, reminder.content, max_characters=80)}\n"
-            for reminder in sorted(user_config.reminders.values(), key=lambda reminder: reminder.datetime)
+            for reminder in sorted(reminders.values(), key=lambda reminder: reminder.datetime)
         ]
 
         await ctx.paginate_embed(
@@ -99,7 +99,7 @@ class Settings(commands.Cog):
         """
 
         if not operation:
-            prefixes = await self.bot.get_prefix(ctx.message)
+            prefixes = await self.bot.get_prefixes(ctx.message)
             await ctx.paginate_embed(
                 entries=[
                     f"`1.` {prefixes[0]}",
@@ -185,11 +185,12 @@ class Settings(commands.Cog):
         """
 
         user_config = await self.bot.user_manager.get_config(ctx.author.id)
+        notifications = await user_config.get_notifications()
 
         await ctx.send(
             embed=utils.embed(
                 title=f"Notification settings for **{ctx.author}**:",
-                description=f"**Levels up:** {utils.readable_bool(user_config.notifications.level_ups)}"
+                description=f"**Levels up:** {utils.readable_bool(notifications.level_ups)}"
             )
         )
 
@@ -205,16 +206,17 @@ class Settings(commands.Cog):
             await converters.EnumConverter(enums.NotificationType, "Notification type").convert(ctx, "a")  # this is a bad way to cause the error but whatever.
 
         user_config = await self.bot.user_manager.get_config(ctx.author.id)
+        notifications = await user_config.get_notifications()
         attr_name = notification_type.value.lower()
 
-        if getattr(user_config.notifications, attr_name) is True:
+        if getattr(notifications, attr_name) is True:
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 emoji=emojis.CROSS,
                 description=f"You already have **{attr_name.replace('_', ' ')}** notifications enabled."
             )
 
-        await user_config.notifications.set_notification(notification_type, True)
+        await notifications.set_notification(notification_type, True)
 
         await ctx.reply(
             embed=utils.embed(
@@ -236,16 +238,17 @@ class Settings(commands.Cog):
             await converters.EnumConverter(enums.NotificationType, "Notification type").convert(ctx, "a")  # this is a bad way to cause the error but whatever.
 
         user_config = await self.bot.user_manager.get_config(ctx.author.id)
+        notifications = await user_config.get_notifications()
         attr_name = notification_type.value.lower()
 
-        if getattr(user_config.notifications, attr_name) is False:
+        if getattr(notifications, attr_name) is False:
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 emoji=emojis.CROSS,
                 description=f"You already have **{attr_name.replace('_', ' ')}** notifications disabled."
             )
 
-        await user_config.notifications.set_notification(notification_type, False)
+        await notifications.set_notification(notification_type, False)
 
         await ctx.reply(
             embed=utils.embed(
@@ -31,7 +31,7 @@ class Tags(commands.Cog):
         name = str(name)
         guild_config = await self.bot.guild_manager.get_config(ctx.guild.id)
 
-        if not (tags := guild_config.get_tags_matching(name=name)):
+        if not (tags := await guild_config.get_tags_matching(name=name)):
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 emoji=emojis.CROSS,
@@ -49,7 +49,7 @@ class Tags(commands.Cog):
             )
 
         if tag.alias:
-            tag = guild_config.get_tag(tag_id=tag.alias)
+            tag = await guild_config.get_tag(tag_id=tag.alias)
 
         await ctx.reply(tag.content)
 
@@ -64,7 +64,7 @@ class Tags(commands.Cog):
         name = str(name)
         guild_config = await self.bot.guild_manager.get_config(ctx.guild.id)
 
-        if not (tags := guild_config.get_tags_matching(name=name)):
+        if not (tags := await guild_config.get_tags_matching(name=name)):
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 emoji=emojis.CROSS,
@@ -82,7 +82,7 @@ class Tags(commands.Cog):
             )
 
         if tag.alias:
-            tag = guild_config.get_tag(tag_id=tag.alias)
+            tag = await guild_config.get_tag(tag_id=tag.alias)
 
         await ctx.reply(discord.utils.escape_markdown(tag.content))
 
@@ -100,7 +100,7 @@ class Tags(commands.Cog):
 
         guild_config = await self.bot.guild_manager.get_config(ctx.guild.id)
 
-        if tag_check := guild_config.get_tag(tag_name=name):
+        if tag_check := await guild_config.get_tag(tag_name=name):
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 emoji=emojis.CROSS,
@@ -131,14 +131,14 @@ class Tags(commands.Cog):
 
         guild_config = await self.bot.guild_manager.get_config(ctx.guild.id)
 
-        if tag_check := guild_config.get_tag(tag_name=alias):
+        if tag_check := await guild_config.get_tag(tag_name=alias):
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 emoji=emojis.CROSS,
                 description=f"There is already a tag with the name **{tag_check.name}**.",
             )
 
-        if not (original_tag := guild_config.get_tag(tag_name=original)):
+        if not (original_tag := await guild_config.get_tag(tag_name=original)):
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 emoji=emojis.CROSS,
@@ -146,7 +146,7 @@ class Tags(commands.Cog):
             )
 
         if original_tag.alias is not None:
-            original_tag = guild_config.get_tag(tag_id=original_tag.alias)
+            original_tag = await guild_config.get_tag(tag_id=original_tag.alias)
 
         tag = await guild_config.create_tag_alias(user_id=ctx.author.id, name=alias, original=original_tag.id, jump_url=ctx.message.jump_url)
 
@@ -275,7 +275,7 @@ class Tags(commands.Cog):
         name = str(name)
         guild_config = await self.bot.guild_manager.get_config(ctx.guild.id)
 
-        if not (tags := guild_config.get_tags_matching(name=name, limit=100)):
+        if not (tags := await guild_config.get_tags_matching(name=name, limit=100)):
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 description=f"There are no tags similar to the search **{name}**."
@@ -298,7 +298,7 @@ class Tags(commands.Cog):
         member = person or ctx.author
         guild_config = await self.bot.guild_manager.get_config(ctx.guild.id)
 
-        if not (tags := guild_config.get_user_tags(member.id)):
+        if not (tags := await guild_config.get_user_tags(member.id)):
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 description=f"**{member}** does not have any tags."
@@ -318,7 +318,7 @@ class Tags(commands.Cog):
 
         guild_config = await self.bot.guild_manager.get_config(ctx.guild.id)
 
-        if not (tags := guild_config.get_all_tags()):
+        if not (tags := await guild_config.get_all_tags()):
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 description="There are no available tags."
@@ -347,7 +347,7 @@ class Tags(commands.Cog):
                 title=f"{tag.name}",
                 description=f"**Owner:** {owner.mention if owner else '*Not found*'} ({tag.user_id})\n"
                             f"**Claimable:** {owner is None}\n"
-                            f"**Alias:** {guild_config.get_tag(tag_id=tag.alias).name if tag.alias else None}\n"
+                            f"**Alias:** {(await guild_config.get_tag(tag_id=tag.alias)).name if tag.alias else None}\n"
                             f"**Created on:** {utils.format_datetime(tag.created_at)}\n"
                             f"**Created:** {utils.format_difference(tag.created_at)} ago\n",
             )
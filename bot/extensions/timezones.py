@@ -125,8 +125,8 @@ class Time(commands.Cog):
         """
 
         async with ctx.typing():
-            file = await self.bot.user_manager.create_timecard(guild_id=ctx.guild.id)
-            await ctx.reply(file=file)
+            files = await self.bot.user_manager.create_timecard(guild_id=ctx.guild.id)
+            await ctx.reply(files=files)
 
     @_timezone.command(name="set")
     async def _timezone_set(self, ctx: custom.Context, *, timezone: Timezone) -> None:
@@ -38,14 +38,14 @@ class Todo(commands.Cog):
             return
 
         user_config = await self.bot.user_manager.get_config(ctx.author.id)
-        if not user_config.todos:
+        if not (todos := await user_config.get_todos()):
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 description="You don't have any todos."
             )
 
         await ctx.paginate_embed(
-            entries=[f"[**`{todo.id}:`**]({todo.jump_url}) {todo.content}" for todo in user_config.todos.values()],
+            entries=[f"[**`{todo.id}:`**]({todo.jump_url}) {todo.content}" for todo in todos.values()],
             per_page=10,
             title=f"Todo list for **{ctx.author}**:",
         )
@@ -74,7 +74,7 @@ class Todo(commands.Cog):
 
         user_config = await self.bot.user_manager.get_config(ctx.author.id)
 
-        if len(user_config.todos) > 100:
+        if len(await user_config.get_todos()) > 100:
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 description="You have 100 todos, try finishing some before adding any more.",
@@ -101,32 +101,32 @@ class Todo(commands.Cog):
         """
 
         user_config = await self.bot.user_manager.get_config(ctx.author.id)
-        if not user_config.todos:
+        if not (todos := await user_config.get_todos()):
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 description="You don't have any todos."
             )
 
-        todos = set()
+        to_delete = set()
 
         for todo_id in todo_ids:
 
-            if not (todo := user_config.get_todo(todo_id)):
+            if not (todo := todos.get(todo_id)):
                 raise exceptions.EmbedError(
                     colour=colours.RED,
                     description=f"You don't have a todo with id **{todo_id}**."
                 )
 
-            todos.add(todo)
+            to_delete.add(todo)
 
-        for todo in todos:
+        for todo in to_delete:
             await todo.delete()
 
         await ctx.paginate_embed(
-            entries=[f"[**`{todo.id}:`**]({todo.jump_url}) {todo.content}" for todo in todos],
+            entries=[f"[**`{todo.id}:`**]({todo.jump_url}) {todo.content}" for todo in to_delete],
             per_page=10,
             colour=colours.GREEN,
-            title=f"Deleted **{len(todos)}** todo{'s' if len(todos) > 1 else ''}:",
+            title=f"Deleted **{len(to_delete)}** todo{'s' if len(to_delete) > 1 else ''}:",
         )
 
     @_todo.command(name="clear")
@@ -139,13 +139,13 @@ class Todo(commands.Cog):
         """
 
         user_config = await self.bot.user_manager.get_config(ctx.author.id)
-        if not user_config.todos:
+        if not (todos := await user_config.get_todos()):
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 description="You don't have any todos."
             )
 
-        for todo in user_config.todos.copy().values():
+        for todo in todos.copy().values():
             await todo.delete()
 
         await ctx.reply(
@@ -0,0 +1,18 @@
+# Future
+from __future__ import annotations
+
+# Standard Library
+import sys
+import types
+
+
+# core/config.py holds the bots tokens and isn't part of the repository, so tests run against a blank one when it's
+# missing.
+try:
+    # My stuff
+    from core import config
+except ImportError:
+    config = types.ModuleType("core.config")
+    for name, value in {"BOT_ID": 0, "BETA_BOT_ID": 0, "PREFIX": "l-"}.items():
+        setattr(config, name, value)
+    sys.modules["core.config"] = config
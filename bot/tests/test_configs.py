@@ -0,0 +1,91 @@
+# Future
+from __future__ import annotations
+
+# Standard Library
+import asyncio
+import datetime
+import types
+from typing import Any
+
+# My stuff
+from utilities import managers
+
+
+class CountingDatabase:
+
+    def __init__(self, row: dict[str, Any]) -> None:
+        self.row: dict[str, Any] = row
+        self.round_trips: int = 0
+
+    async def fetchrow(self, query: str, *args: Any) -> dict[str, Any]:
+
+        self.round_trips += 1
+
+        # Yield so that every concurrent caller reaches the cache miss before the first fetch finishes.
+        await asyncio.sleep(0.01)
+        return self.row | {"id": args[0]}
+
+
+USER_ROW = {
+    "created_at":         datetime.datetime(2021, 1, 1),
+    "blacklisted":        False,
+    "blacklisted_reason": None,
+    "timezone":           None,
+    "timezone_private":   False,
+    "birthday":           None,
+    "birthday_private":   False,
+}
+GUILD_ROW = {
+    "created_at": datetime.datetime(2021, 1, 1),
+    "embed_size": 3,
+    "prefixes":   [],
+}
+
+
+def test_concurrent_user_config_fetches_share_one_round_trip() -> None:
+
+    async def run() -> None:
+
+        bot = types.SimpleNamespace(db=CountingDatabase(USER_ROW))
+        user_manager = managers.UserManager(bot=bot)  # type: ignore
+
+        user_configs = await asyncio.gather(*(user_manager.get_config(1) for _ in range(100)))
+
+        assert bot.db.round_trips == 1
+        assert all(user_config is user_configs[0] for user_config in user_configs)
+
+        await user_manager.get_config(1)
+        assert bot.db.round_trips == 1
+
+    asyncio.run(run())
+
+
+def test_concurrent_guild_config_fetches_share_one_round_trip() -> None:
+
+    async def run() -> None:
+
+        bot = types.SimpleNamespace(db=CountingDatabase(GUILD_ROW))
+        guild_manager = managers.GuildManager(bot=bot)  # type: ignore
+
+        guild_configs = await asyncio.gather(*(guild_manager.get_config(1) for _ in range(100)))
+
+        assert bot.db.round_trips == 1
+        assert all(guild_config is guild_configs[0] for guild_config in guild_configs)
+
+        await guild_manager.get_config(1)
+        assert bot.db.round_trips == 1
+
+    asyncio.run(run())
+
+
+def test_different_keys_are_fetched_separately() -> None:
+
+    async def run() -> None:
+
+        bot = types.SimpleNamespace(db=CountingDatabase(USER_ROW))
+        user_manager = managers.UserManager(bot=bot)  # type: ignore
+
+        await asyncio.gather(*(user_manager.get_config(user_id) for user_id in range(10) for _ in range(10)))
+        assert bot.db.round_trips == 10
+
+    asyncio.run(run())
@@ -0,0 +1,263 @@
+# Future
+from __future__ import annotations
+
+# Standard Library
+import asyncio
+import collections
+import sys
+import time
+from collections.abc import Callable, Coroutine, Hashable, Iterator
+from typing import Any, Generic, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def approximate_size(obj: Any, *, exclude: tuple[Any, ...] = (), max_depth: int = 5) -> int:
+
+    seen: set[int] = {id(item) for item in exclude}
+    size = 0
+
+    stack: list[tuple[Any, int]] = [(obj, 0)]
+
+    while stack:
+
+        item, depth = stack.pop()
+
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+
+        size += sys.getsizeof(item, 0)
+
+        if depth >= max_depth:
+            continue
+
+        if isinstance(item, dict):
+            stack.extend((child, depth + 1) for pair in item.items() for child in pair)
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend((child, depth + 1) for child in item)
+        elif hasattr(item, "__dict__"):
+            stack.append((vars(item), depth + 1))
+
+    return size
+
+
+class CacheStats:
+
+    def __init__(self) -> None:
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def __repr__(self) -> str:
+        return f"<CacheStats hits={self.hits}, misses={self.misses}, evictions={self.evictions}, expirations={self.expirations}>"
+
+    @property
+    def hit_rate(self) -> float:
+
+        if not (total := self.hits + self.misses):
+            return 0.0
+
+        return self.hits / total
+
+
+class LRUCache(Generic[K, V]):
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        max_size: int | None = None,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        sizeof: Callable[[V], int] = approximate_size,
+        pinned: Callable[[V], bool] | None = None,
+    ) -> None:
+
+        self.name: str = name
+        self.max_size: int | None = max_size
+        self.max_bytes: int | None = max_bytes
+        self.ttl: float | None = ttl
+
+        self._sizeof: Callable[[V], int] = sizeof
+        self._pinned: Callable[[V], bool] | None = pinned
+
+        # key -> (value, approximate size, time of insertion)
+        self._data: collections.OrderedDict[K, tuple[V, int, float]] = collections.OrderedDict()
+        self._bytes: int = 0
+
+        self.stats: CacheStats = CacheStats()
+
+    def __repr__(self) -> str:
+        return f"<LRUCache name='{self.name}', size={len(self)}, bytes={self.bytes}, max_size={self.max_size}, max_bytes={self.max_bytes}, ttl={self.ttl}>"
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._data and not self._is_expired(key)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self._data))
+
+    def __getitem__(self, key: K) -> V:
+
+        if (value := self.get(key)) is None:
+            raise KeyError(key)
+
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: K) -> None:
+
+        _, size, _ = self._data.pop(key)
+        self._bytes -= size
+
+    # Properties
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    # Internal
+
+    def _is_expired(self, key: K) -> bool:
+
+        if self.ttl is None:
+            return False
+
+        value, _, inserted_at = self._data[key]
+        return time.monotonic() - inserted_at > self.ttl and not self._is_pinned(value)
+
+    def _is_pinned(self, value: V) -> bool:
+        return self._pinned is not None and self._pinned(value)
+
+    def _is_full(self) -> bool:
+        return (self.max_size is not None and len(self._data) > self.max_size) or (self.max_bytes is not None and self._bytes > self.max_bytes)
+
+    def _evict(self) -> None:
+
+        # Evict from the least recently used end. Pinned entries are moved to the other end as they're skipped, so
+        # that later evictions don't walk over them again (e.g. the users with reminders that are all loaded first on
+        # startup). A cache full of pinned entries stops after one pass instead of spinning.
+        skipped = 0
+
+        while self._is_full() and skipped < len(self._data):
+
+            key = next(iter(self._data))
+            value, _, _ = self._data[key]
+
+            if self._is_pinned(value):
+                self._data.move_to_end(key)
+                skipped += 1
+                continue
+
+            del self[key]
+            self.stats.evictions += 1
+
+    # Public
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+
+        if key not in self._data:
+            self.stats.misses += 1
+            return default
+
+        if self._is_expired(key):
+            del self[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+
+        return self._data[key][0]
+
+    def peek(self, key: K) -> V | None:
+
+        # Unlike get, this doesn't count towards the stats or refresh the entries position.
+        if key not in self._data or self._is_expired(key):
+            return None
+
+        return self._data[key][0]
+
+    def set(self, key: K, value: V) -> None:
+
+        # Measuring can mean walking a large object graph, so setting the same value again keeps its recorded size.
+        # Values that have grown since they were set are measured again with 'touch'.
+        if (entry := self._data.get(key)) is not None and entry[0] is value:
+            size = entry[1]
+        else:
+            size = self._sizeof(value)
+
+        if key in self._data:
+            del self[key]
+
+        self._data[key] = (value, size, time.monotonic())
+        self._bytes += size
+
+        self._evict()
+
+    def touch(self, key: K) -> None:
+
+        # Sizes are measured once when an entry is set and cached with it, so values that grow afterwards (e.g. a user
+        # config having its reminders loaded) have to be measured again explicitly for max_bytes to mean anything. This
+        # doesn't count towards the stats or refresh the entries position.
+        if key not in self._data:
+            return
+
+        value, size, inserted_at = self._data[key]
+        new_size = self._sizeof(value)
+
+        self._data[key] = (value, new_size, inserted_at)
+        self._bytes += new_size - size
+
+        self._evict()
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+
+        if key not in self._data:
+            return default
+
+        value, _, _ = self._data[key]
+        del self[key]
+
+        return value
+
+    def values(self) -> list[V]:
+        return [value for value, _, _ in self._data.values()]
+
+    def clear(self) -> None:
+
+        self._data.clear()
+        self._bytes = 0
+
+
+class SingleFlight(Generic[K, V]):
+
+    def __init__(self) -> None:
+        self._pending: dict[K, asyncio.Task[V]] = {}
+
+    def __repr__(self) -> str:
+        return f"<SingleFlight pending={len(self._pending)}>"
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def do(self, key: K, factory: Callable[[], Coroutine[Any, Any, V]]) -> V:
+
+        # The work runs in its own task and every caller awaits it through a shield, so a caller being cancelled (e.g.
+        # a command timing out) doesn't cancel the fetch for everyone else waiting on the same key.
+        if (task := self._pending.get(key)) is None:
+            task = asyncio.create_task(factory())
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+            self._pending[key] = task
+
+        return await asyncio.shield(task)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Literal
 
 # Packages
+import discord
 from discord.ext import commands
 
 # My stuff
@@ -12,24 +13,24 @@ from core import colours, values
 from utilities import custom, exceptions
 
 
-async def global_check(ctx: custom.Context) -> Literal[True]:
+NEEDED_PERMISSIONS = values.PERMISSIONS.value
+READ_MESSAGES = discord.Permissions(read_messages=True).value
+
 
-    user_config = await ctx.bot.user_manager.get_config(ctx.author.id)
+async def global_check(ctx: custom.Context) -> Literal[True]:
 
-    if user_config.blacklisted is True:
+    if ctx.author.id in ctx.bot.user_manager.blacklist:
         raise exceptions.EmbedError(
             colour=colours.RED,
             description=f"You are blacklisted from using this bot.\n\n"
                         f"*If you would like to appeal this please join my [support server]({values.SUPPORT_LINK}).*",
         )
 
-    current = dict(ctx.channel.permissions_for(ctx.me))
+    current = ctx.channel.permissions_for(ctx.me).value
     if not ctx.guild:
-        current["read_messages"] = True
-
-    needed = {permission: value for permission, value in values.PERMISSIONS if value is True}
+        current |= READ_MESSAGES
 
-    if missing := [permission for permission, value in needed.items() if current[permission] != value]:
-        raise commands.BotMissingPermissions(missing)
+    if missing := NEEDED_PERMISSIONS & ~current:
+        raise commands.BotMissingPermissions([permission for permission, value in discord.Permissions(missing) if value is True])
 
     return True
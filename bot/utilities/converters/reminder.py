@@ -23,7 +23,7 @@ class ReminderConverter(commands.Converter[objects.Reminder]):
 
         user_config = await ctx.bot.user_manager.get_config(ctx.author.id)
 
-        if not (reminder := user_config.get_reminder(reminder_id)):
+        if not (reminder := await user_config.get_reminder(reminder_id)):
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 description="You do not have a reminder with that id."
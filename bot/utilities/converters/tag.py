@@ -26,7 +26,7 @@ class TagConverter(commands.Converter[objects.Tag]):
 
         guild_config = await ctx.bot.guild_manager.get_config(ctx.guild.id)
 
-        if not (tag := guild_config.get_tag(tag_name=name)):
+        if not (tag := await guild_config.get_tag(tag_name=name)):
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 description=f"There are no tags with the name **{name}**."
@@ -23,7 +23,7 @@ class TodoConverter(commands.Converter[objects.Todo]):
 
         user_config = await ctx.bot.user_manager.get_config(ctx.author.id)
 
-        if not (todo := user_config.get_todo(todo_id)):
+        if not (todo := await user_config.get_todo(todo_id)):
             raise exceptions.EmbedError(
                 colour=colours.RED,
                 description=f"You don't have a todo with id **{todo_id}**."
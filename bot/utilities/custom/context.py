@@ -181,6 +181,30 @@ class Context(commands.Context["Life"]):
         await paginator.paginate()
         return paginator
 
+    async def paginate_lazy_text(
+        self,
+        *,
+        entries: list[functools.partial],
+        timeout: int = 300,
+        delete_message: bool = False,
+        codeblock: bool = False,
+        header: str | None = None,
+        footer: str | None = None,
+    ) -> paginators.LazyTextPaginator:
+
+        paginator = paginators.LazyTextPaginator(
+            ctx=self,
+            entries=entries,
+            timeout=timeout,
+            delete_message=delete_message,
+            codeblock=codeblock,
+            header=header,
+            footer=footer,
+        )
+
+        await paginator.paginate()
+        return paginator
+
     async def paginate_embeds(
         self,
         *,
@@ -0,0 +1,52 @@
+# Future
+from __future__ import annotations
+
+# Standard Library
+import io
+from typing import Any
+
+# Packages
+from PIL import Image
+
+
+class Encoder:
+
+    def __init__(self, *, name: str, format: str, colours: int | None = None, **options: Any) -> None:
+
+        self.name: str = name
+        self.format: str = format
+        self.colours: int | None = colours
+        self.options: dict[str, Any] = options
+
+    def __repr__(self) -> str:
+        return f"<Encoder name='{self.name}', format='{self.format}', colours={self.colours}, options={self.options}>"
+
+    def encode(self, image: Image.Image) -> tuple[bytes, str]:
+        """
+        Encodes ``image`` and returns its bytes along with the file format they're in.
+        """
+
+        buffer = io.BytesIO()
+
+        if self.colours is not None:
+            # Quantising an image with transparency needs fast octree, median cut only supports RGB.
+            method = Image.FASTOCTREE if image.mode == "RGBA" else Image.MEDIANCUT
+            with image.quantize(colors=self.colours, method=method) as quantized:
+                quantized.save(buffer, self.format, **self.options)
+        else:
+            image.save(buffer, self.format, **self.options)
+
+        return buffer.getvalue(), self.format
+
+
+# Lossless WebP at its fastest settings is both quicker to encode and smaller than PNG for the cards, palette PNG is
+# exact for images with only a handful of colours, and the grids stay as PNG since WebP is no smaller for them.
+PNG = Encoder(name="png", format="png")
+PALETTE_PNG = Encoder(name="palette png", format="png", colours=256, optimize=True)
+WEBP_LOSSLESS = Encoder(name="lossless webp", format="webp", lossless=True, quality=0, method=0)
+
+LEVEL_CARD = WEBP_LOSSLESS
+LEADERBOARD = WEBP_LOSSLESS
+GRID = PNG
+COLOUR_SQUARE = WEBP_LOSSLESS
+COLOUR_SCHEME = PALETTE_PNG
@@ -67,6 +67,12 @@ class NotificationType(Enum):
     LEVELS = LEVEL_UP
 
 
+class CooldownBackend(Enum):
+
+    MEMORY = 1
+    REDIS = 2
+
+
 class Filters(Enum):
 
     ROTATION = 1
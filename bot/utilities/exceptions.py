@@ -14,6 +14,10 @@ class LifeError(commands.CommandError):
     pass
 
 
+class ImageError(LifeError):
+    pass
+
+
 class EmbedError(LifeError):
 
     def __init__(
@@ -0,0 +1,52 @@
+# Future
+from __future__ import annotations
+
+# Standard Library
+import functools
+import os
+
+# Packages
+from PIL import ImageFont
+
+
+ARIAL = os.path.abspath(os.path.join(os.path.dirname(__file__), "../resources/fonts/arial.ttf"))
+KABEL_BLACK = os.path.abspath(os.path.join(os.path.dirname(__file__), "../resources/fonts/kabel_black.otf"))
+
+
+@functools.lru_cache(maxsize=256)
+def font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(font=path, size=size)
+
+
+@functools.lru_cache(maxsize=4096)
+def fitted_size(text: str, path: str, size: int, bounds: tuple[int, int]) -> int:
+
+    # The text fits when its size isn't greater than the bounds, compared as tuples the same way the renderers always
+    # have. That is monotonic in the font size, so the largest size that fits can be binary searched for instead of
+    # stepping down one point at a time.
+    def fits(_size: int) -> bool:
+        return not font(path, _size).getsize(text) > bounds
+
+    if fits(size):
+        return size
+
+    low, high = 1, size - 1
+
+    while low < high:
+
+        middle = (low + high + 1) // 2
+
+        if fits(middle):
+            low = middle
+        else:
+            high = middle - 1
+
+    return low
+
+
+def fit(text: str, *, path: str, size: int, bounds: tuple[int, int]) -> ImageFont.FreeTypeFont:
+    """
+    Returns the largest font no bigger than ``size`` that ``text`` fits within ``bounds`` in.
+    """
+
+    return font(path, fitted_size(text, path, size, bounds))
@@ -2,9 +2,8 @@
 from __future__ import annotations
 
 # Standard Library
-import multiprocessing
-import sys
-from multiprocessing.connection import Connection
+import asyncio
+import logging
 from typing import Any, Callable, Literal
 
 # Packages
@@ -17,9 +16,11 @@ from wand.image import Image
 
 # My stuff
 from core import colours, emojis
-from utilities import custom, exceptions, objects, utils
+from utilities import custom, exceptions, objects, utils, workers
 
 
+__log__: logging.Logger = logging.getLogger("utilities.imaging")
+
 PixelInterpolateMethods = Literal[
     "undefined",
     "average",
@@ -187,6 +188,10 @@ MAX_CONTENT_SIZE = (2 ** 20) * 25
 VALID_CONTENT_TYPES = ["image/gif", "image/heic", "image/jpeg", "image/png", "image/webp", "image/avif", "image/svg+xml"]
 COMMON_GIF_SITES = ["tenor.com", "giphy.com", "gifer.com"]
 
+# GIFs with fewer frames than this are edited by a single worker, splitting them up costs more than it saves. Splitting
+# passes the coalesced frames between workers uncompressed (width * height * 4 bytes each) through shared memory.
+PARALLEL_GIF_MIN_FRAMES = 16
+
 
 async def request_image_bytes(*, session: aiohttp.ClientSession, url: str) -> bytes:
 
@@ -232,21 +237,23 @@ async def edit_image(ctx: custom.Context, edit_function: Callable[..., Any], ima
     message = await ctx.reply(embed=embed)
 
     image_bytes = await request_image_bytes(session=ctx.bot.session, url=image.url)
-    receiving_pipe, sending_pipe = multiprocessing.Pipe(duplex=False)
-
-    process = multiprocessing.Process(target=do_edit_image, daemon=True, args=(edit_function, image_bytes, sending_pipe), kwargs=kwargs)
-    process.start()
-
-    data = await ctx.bot.loop.run_in_executor(None, receiving_pipe.recv)
+    parallel = ctx.bot.image_pool.max_workers > 1 and estimate_gif_frames(image_bytes) >= PARALLEL_GIF_MIN_FRAMES
 
-    process.join()
+    # The image goes to and from the worker through shared memory, only the segments names and sizes are pickled.
+    source = workers.SharedBuffer.create(image_bytes)
+    del image_bytes
 
-    receiving_pipe.close()
-    sending_pipe.close()
-    process.terminate()
-    process.close()
+    try:
+        if parallel:
+            edited_descriptor, edited_image_format = await edit_gif_in_parallel(ctx.bot.image_pool, edit_function, source.descriptor, kwargs)
+        else:
+            edited_descriptor, edited_image_format = await ctx.bot.image_pool.run(
+                do_edit_image, edit_function, source.descriptor, kwargs,
+                release=lambda result: unlink_buffers(result[0]),
+            )
+    except Exception as error:
 
-    if data is ValueError or data is EOFError:
+        __log__.warning(f"[IMAGING] Failed to edit image with '{edit_function.__name__}'.", exc_info=error)
 
         try:
             await message.delete()
@@ -257,8 +264,17 @@ async def edit_image(ctx: custom.Context, edit_function: Callable[..., Any], ima
             colour=colours.RED,
             description="Something went wrong while editing that image."
         )
+    finally:
+        source.close()
+        source.unlink()
+
+    with workers.SharedBuffer.attach(edited_descriptor) as edited:
+        try:
+            edited_image_bytes = edited.read()
+        finally:
+            edited.unlink()
 
-    url = await utils.upload_file(ctx.bot.session, file_bytes=data[0], file_format=data[1])
+    url = await utils.upload_file(ctx.bot.session, file_bytes=edited_image_bytes, file_format=edited_image_format)
 
     try:
         await message.delete()
@@ -267,35 +283,170 @@ async def edit_image(ctx: custom.Context, edit_function: Callable[..., Any], ima
 
     await ctx.reply(url)
 
-    del data
 
+def estimate_gif_frames(image_bytes: bytes) -> int:
 
-def do_edit_image(edit_function: Callable[..., Any], image_bytes: bytes, pipe: Connection, **kwargs) -> None:
+    if image_bytes[:6] not in (b"GIF87a", b"GIF89a"):
+        return 0
+
+    # Every frame of an animated GIF starts with a graphic control extension. Counting their headers is only an
+    # estimate (the same bytes can turn up inside frame data), but it's enough to decide whether to split the frames
+    # up, and it's much cheaper than walking the file block by block on the event loop.
+    return image_bytes.count(b"\x21\xf9\x04")
+
+
+async def edit_gif_in_parallel(
+    pool: workers.WorkerPool,
+    edit_function: Callable[..., Any],
+    source: tuple[str, int],
+    kwargs: dict[str, Any]
+) -> tuple[tuple[str, int], str]:
+
+    # Effects are applied to GIFs one frame at a time (see ``do_edit_image``), so the frames can be edited by different
+    # workers. One worker decodes and splits the GIF into contiguous chunks, every worker edits a chunk, then one joins
+    # the edited chunks back together in order.
+    chunks = await pool.run(do_split_frames, source, pool.max_workers, release=lambda result: unlink_buffers(*result))
+    edited_chunks: list[tuple[str, int]] = []
 
     try:
-        with Image(blob=image_bytes) as image, Color("transparent") as colour:
+        results = await asyncio.gather(
+            *(pool.run(do_edit_frames, edit_function, chunk, kwargs, release=unlink_buffers) for chunk in chunks),
+            return_exceptions=True,
+        )
+        edited_chunks = [result for result in results if isinstance(result, tuple)]
 
-            if image.format != "GIF":
-                image.background_color = colour
-                edit_function(image, **kwargs)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return await pool.run(do_join_frames, edited_chunks, release=lambda result: unlink_buffers(result[0]))
+
+    finally:
+        unlink_buffers(*chunks, *edited_chunks)
+
+
+def unlink_buffers(*descriptors: tuple[str, int]) -> None:
+
+    for descriptor in descriptors:
+        with workers.SharedBuffer.attach(descriptor) as buffer:
+            buffer.unlink()
+
+
+def initialise() -> None:
+    # Runs once in every image worker as it starts, so that ImageMagick is loaded and initialised before the first
+    # edit rather than during it.
+    with Image(width=1, height=1):
+        pass
+
+
+def make_blob(image: Image, format: str | None = None) -> bytes:
+
+    # Wand returns None rather than raising when ImageMagick can't encode the image.
+    if (blob := image.make_blob(format=format)) is None:
+        raise exceptions.ImageError(f"ImageMagick was unable to encode the image as '{format or image.format}'.")
+
+    return blob
+
+
+def do_edit_image(
+    edit_function: Callable[..., Any],
+    source: tuple[str, int],
+    kwargs: dict[str, Any]
+) -> tuple[tuple[str, int], str]:
+    # Runs in the image worker pool, any exception raised here is raised again from ``WorkerPool.run``. The source
+    # image is read from, and the edited one written to, shared memory. Wand only reads blobs from bytes so each side
+    # still needs one copy, but nothing is pickled or pushed through the pools pipes.
 
-            else:
-                image.coalesce()
-                image.iterator_reset()
+    with workers.SharedBuffer.attach(source) as buffer:
+        image_bytes = buffer.read()
 
+    with Image(blob=image_bytes) as image, Color("transparent") as colour:
+
+        if image.format != "GIF":
+            image.background_color = colour
+            edit_function(image, **kwargs)
+
+        else:
+            image.coalesce()
+            image.iterator_reset()
+
+            image.background_color = colour
+            edit_function(image, **kwargs)
+            while image.iterator_next():
                 image.background_color = colour
                 edit_function(image, **kwargs)
-                while image.iterator_next():
-                    image.background_color = colour
-                    edit_function(image, **kwargs)
 
-                image.optimize_transparency()
+            image.optimize_transparency()
+
+        # Images decoded from a blob always have a format.
+        assert image.format is not None
+
+        with workers.SharedBuffer.create(make_blob(image)) as edited:
+            return edited.descriptor, image.format
+
+
+def do_split_frames(source: tuple[str, int], chunks: int) -> list[tuple[str, int]]:
+    # Decodes and coalesces a GIF once, then writes its frames as up to ``chunks`` contiguous MIFF chunks, which keep
+    # each frames delay, disposal and full colour for ``do_edit_frames`` and ``do_join_frames``.
+
+    with workers.SharedBuffer.attach(source) as buffer:
+        image_bytes = buffer.read()
+
+    descriptors = []
+
+    with Image(blob=image_bytes) as image:
+
+        image.coalesce()
+
+        frames = len(image.sequence)
+        chunks = min(chunks, frames)
+
+        for index in range(chunks):
+
+            start, stop = frames * index // chunks, frames * (index + 1) // chunks
+
+            with Image() as chunk:
+                chunk.sequence.extend(image.sequence[start:stop])
+                with workers.SharedBuffer.create(make_blob(chunk, format="miff")) as frames_buffer:
+                    descriptors.append(frames_buffer.descriptor)
+
+    return descriptors
+
+
+def do_edit_frames(edit_function: Callable[..., Any], chunk: tuple[str, int], kwargs: dict[str, Any]) -> tuple[str, int]:
+    # Edits a chunk of coalesced frames the same way ``do_edit_image`` edits a whole GIF.
+
+    with workers.SharedBuffer.attach(chunk) as buffer:
+        chunk_bytes = buffer.read()
+
+    with Image(blob=chunk_bytes, format="miff") as image, Color("transparent") as colour:
+
+        image.iterator_reset()
+
+        image.background_color = colour
+        edit_function(image, **kwargs)
+        while image.iterator_next():
+            image.background_color = colour
+            edit_function(image, **kwargs)
+
+        with workers.SharedBuffer.create(make_blob(image, format="miff")) as edited:
+            return edited.descriptor
+
+
+def do_join_frames(chunks: list[tuple[str, int]]) -> tuple[tuple[str, int], str]:
+
+    with Image() as image:
+
+        for chunk in chunks:
+
+            with workers.SharedBuffer.attach(chunk) as buffer:
+                chunk_bytes = buffer.read()
 
-            edited_image_format = image.format
-            edited_image_bytes = image.make_blob()
+            with Image(blob=chunk_bytes, format="miff") as frames:
+                image.sequence.extend(frames.sequence)
 
-            pipe.send((edited_image_bytes, edited_image_format))
+        image.optimize_transparency()
+        image.format = "gif"
 
-    except Exception as e:
-        print(e, file=sys.stderr)
-        pipe.send(ValueError)
+        with workers.SharedBuffer.create(make_blob(image)) as edited:
+            return edited.descriptor, image.format
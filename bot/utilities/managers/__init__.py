@@ -2,5 +2,9 @@
 from __future__ import annotations
 
 # My stuff
+from utilities.managers.avatars import AvatarManager
+from utilities.managers.cooldowns import CooldownManager, RedisCooldownManager
 from utilities.managers.guilds import GuildManager
+from utilities.managers.members import MemberManager
+from utilities.managers.ranks import GuildRanks, RankManager
 from utilities.managers.users import UserManager
@@ -0,0 +1,190 @@
+# Future
+from __future__ import annotations
+
+# Standard Library
+import asyncio
+import functools
+import logging
+import os
+import pathlib
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+# Packages
+import discord
+
+# My stuff
+from core import values
+from utilities import cache
+
+
+if TYPE_CHECKING:
+    # My stuff
+    from core.bot import Life
+
+__log__: logging.Logger = logging.getLogger("utilities.managers.avatars")
+
+FETCH_CONCURRENCY = 16
+
+# Pruning the disk cache deletes avatars until it's back down to this fraction of its limit, so that it isn't pruned
+# again on the very next write.
+DISK_PRUNE_TARGET = 0.9
+
+
+class AvatarManager:
+
+    def __init__(self, bot: Life) -> None:
+        self.bot: Life = bot
+
+        # (avatar key, size) -> png bytes. Avatar keys change whenever the avatar does so entries never go stale.
+        self.cache: cache.LRUCache[tuple[str, int], bytes] = cache.LRUCache(
+            name="avatars",
+            max_bytes=64 * (2 ** 20),
+            sizeof=len,
+        )
+        self.users: cache.LRUCache[int, discord.User] = cache.LRUCache(
+            name="users (api)",
+            max_size=5000,
+            ttl=3600,
+            sizeof=lambda _: 0,
+        )
+
+        self._fetches: cache.SingleFlight[tuple[str, int], bytes] = cache.SingleFlight()
+        self._user_fetches: cache.SingleFlight[int, discord.User] = cache.SingleFlight()
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+        self.disk_path: pathlib.Path | None = values.AVATAR_DISK_CACHE_PATH
+        if self.disk_path is not None:
+            self.disk_path.mkdir(parents=True, exist_ok=True)
+
+        # Bytes on disk, estimated from the writes since the last prune. None until the first prune has measured it.
+        self._disk_bytes: int | None = None
+        self._pruning: bool = False
+
+    # Disk
+
+    def _disk_file(self, key: tuple[str, int]) -> pathlib.Path | None:
+
+        if self.disk_path is None:
+            return None
+
+        avatar_key, size = key
+        return self.disk_path / f"{avatar_key}_{size}.png"
+
+    @staticmethod
+    def _read_file(file: pathlib.Path) -> bytes:
+
+        data = file.read_bytes()
+        # Pruning deletes the files with the oldest modification times first, so reads refresh it.
+        os.utime(file)
+
+        return data
+
+    def _prune_files(self) -> int:
+
+        assert self.disk_path is not None
+
+        files = []
+
+        for file in self.disk_path.glob("*.png"):
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, file))
+
+        total = sum(size for _, size, _ in files)
+        target = values.AVATAR_DISK_CACHE_MAX_BYTES * DISK_PRUNE_TARGET
+
+        for _, size, file in sorted(files):
+
+            if total <= target:
+                break
+
+            file.unlink(missing_ok=True)
+            total -= size
+
+        return total
+
+    async def _prune_disk(self) -> None:
+
+        self._pruning = True
+
+        try:
+            self._disk_bytes = await self.bot.loop.run_in_executor(None, self._prune_files)
+        except OSError as error:
+            __log__.warning("[AVATARS] Failed to prune the avatar disk cache.", exc_info=error)
+        finally:
+            self._pruning = False
+
+    async def _read_disk(self, key: tuple[str, int]) -> bytes | None:
+
+        if (file := self._disk_file(key)) is None:
+            return None
+
+        try:
+            return await self.bot.loop.run_in_executor(None, self._read_file, file)
+        except FileNotFoundError:
+            return None
+
+    async def _write_disk(self, key: tuple[str, int], data: bytes) -> None:
+
+        if (file := self._disk_file(key)) is None:
+            return
+
+        try:
+            await self.bot.loop.run_in_executor(None, file.write_bytes, data)
+        except OSError as error:
+            __log__.warning(f"[AVATARS] Failed to write avatar '{file.name}' to the disk cache.", exc_info=error)
+            return
+
+        if self._disk_bytes is not None:
+            self._disk_bytes += len(data)
+
+        if (self._disk_bytes is None or self._disk_bytes > values.AVATAR_DISK_CACHE_MAX_BYTES) and not self._pruning:
+            await self._prune_disk()
+
+    # Avatars
+
+    async def fetch_avatar(self, asset: discord.Asset, key: tuple[str, int]) -> bytes:
+
+        if (data := await self._read_disk(key)) is None:
+
+            async with self._semaphore:
+                data = await asset.replace(format="png", size=key[1]).read()
+
+            await self._write_disk(key, data)
+
+        self.cache[key] = data
+        return data
+
+    async def get_avatar(self, asset: discord.Asset, *, size: int) -> bytes:
+
+        key = (asset.key, size)
+
+        if (data := self.cache.get(key)) is not None:
+            return data
+
+        return await self._fetches.do(key, functools.partial(self.fetch_avatar, asset, key))
+
+    async def get_avatars(self, assets: Iterable[discord.Asset], *, size: int) -> list[bytes]:
+        return list(await asyncio.gather(*(self.get_avatar(asset, size=size) for asset in assets)))
+
+    # Users
+
+    async def fetch_user(self, user_id: int) -> discord.User:
+
+        user = await self.bot.fetch_user(user_id)
+        self.users[user_id] = user
+
+        return user
+
+    async def get_user(self, user_id: int) -> discord.User:
+        """
+        Returns a cached user from the API, for people who aren't in any of the bots guilds.
+        """
+
+        if (user := self.users.get(user_id)) is not None:
+            return user
+
+        return await self._user_fetches.do(user_id, functools.partial(self.fetch_user, user_id))
@@ -0,0 +1,120 @@
+# Future
+from __future__ import annotations
+
+# Standard Library
+import asyncio
+import time
+
+# Packages
+import aioredis
+
+
+class CooldownManager:
+
+    def __init__(self, *, name: str, per: int) -> None:
+
+        self.name: str = name
+        self.per: int = per
+
+        # Keys are (user_id, guild_id) pairs packed into a single int and map to the second their cooldown ends. Expired
+        # keys are removed by a timing wheel with one slot per second, so each call only sweeps the slots for the
+        # seconds that have passed since the last one instead of scanning every key.
+        self._expiries: dict[int, int] = {}
+        self._wheel: list[list[int]] = [[] for _ in range(per + 1)]
+        self._swept: int = int(time.monotonic())
+
+    def __repr__(self) -> str:
+        return f"<CooldownManager name='{self.name}', per={self.per}, size={len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self._expiries)
+
+    @staticmethod
+    def _key(user_id: int, guild_id: int) -> int:
+        return (user_id << 64) | guild_id
+
+    def _sweep(self, now: int) -> None:
+
+        # Catching up on more seconds than there are slots would only revisit the same slots again.
+        start = max(self._swept + 1, now - len(self._wheel) + 1)
+
+        for second in range(start, now + 1):
+
+            slot = self._wheel[second % len(self._wheel)]
+
+            for key in slot:
+                if self._expiries.get(key, now + 1) <= now:
+                    del self._expiries[key]
+
+            slot.clear()
+
+        self._swept = now
+
+    async def try_acquire(self, user_id: int, guild_id: int) -> bool:
+
+        now = int(time.monotonic())
+        self._sweep(now)
+
+        key = self._key(user_id, guild_id)
+
+        if key in self._expiries:
+            return False
+
+        expiry = now + self.per
+        self._expiries[key] = expiry
+        self._wheel[expiry % len(self._wheel)].append(key)
+
+        return True
+
+
+class RedisCooldownManager:
+
+    def __init__(self, *, name: str, per: int, redis: aioredis.Redis) -> None:
+
+        self.name: str = name
+        self.per: int = per
+        self.redis: aioredis.Redis = redis
+
+        self._queue: list[tuple[str, asyncio.Future[bool]]] = []
+        self._flush: asyncio.Task[None] | None = None
+
+    def __repr__(self) -> str:
+        return f"<RedisCooldownManager name='{self.name}', per={self.per}, queued={len(self._queue)}>"
+
+    async def _flush_queue(self) -> None:
+
+        # Keys queued while a batch is in flight are sent together in the next one, so bursts are batched without making
+        # a lone message wait for anything.
+        while self._queue:
+
+            queue, self._queue = self._queue, []
+
+            try:
+                # A pipeline costs more than it saves for a single key, which is the usual case outside of bursts.
+                if len(queue) == 1:
+                    results = [await self.redis.set(name=queue[0][0], value="", ex=self.per, nx=True)]
+                else:
+                    async with self.redis.pipeline(transaction=False) as pipeline:
+                        for key, _ in queue:
+                            pipeline.set(name=key, value="", ex=self.per, nx=True)
+                        results = await pipeline.execute()
+            except Exception as error:
+                for _, future in queue:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+
+            for (_, future), result in zip(queue, results):
+                if not future.done():
+                    future.set_result(bool(result))
+
+    async def try_acquire(self, user_id: int, guild_id: int) -> bool:
+
+        # SET NX both checks and starts the cooldown, replacing the separate EXISTS and SETEX round trips.
+        future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._queue.append((f"{user_id}_{guild_id}_{self.name}", future))
+
+        if self._flush is None or self._flush.done():
+            self._flush = asyncio.create_task(self._flush_queue())
+
+        return await future
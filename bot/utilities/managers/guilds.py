@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 # Standard Library
+import functools
 import logging
+import time
 from typing import TYPE_CHECKING
 
 # My stuff
-from utilities import objects
+from utilities import cache, objects
 
 
 if TYPE_CHECKING:
@@ -21,15 +23,19 @@ class GuildManager:
     def __init__(self, bot: Life) -> None:
         self.bot: Life = bot
 
-        self.cache: dict[int, objects.GuildConfig] = {}
+        self.cache: cache.LRUCache[int, objects.GuildConfig] = cache.LRUCache(
+            name="guilds",
+            max_size=25_000,
+            max_bytes=128 * (2 ** 20),
+            sizeof=functools.partial(cache.approximate_size, exclude=(bot,)),
+        )
+        self._fetches: cache.SingleFlight[int, objects.GuildConfig] = cache.SingleFlight()
 
     async def fetch_config(self, guild_id: int) -> objects.GuildConfig:
 
         data = await self.bot.db.fetchrow("INSERT INTO guilds (id) values ($1) ON CONFLICT (id) DO UPDATE SET id = excluded.id RETURNING *", guild_id)
         guild_config = objects.GuildConfig(bot=self.bot, data=data)
 
-        await guild_config.fetch_tags()
-
         self.cache[guild_config.id] = guild_config
 
         __log__.debug(f"[GUILDS] Cached config for '{guild_id}'.")
@@ -40,7 +46,18 @@ class GuildManager:
         if (guild_config := self.cache.get(guild_id)) is not None:
             return guild_config
 
-        return await self.fetch_config(guild_id)
+        return await self._fetches.do(guild_id, functools.partial(self.fetch_config, guild_id))
+
+    async def preload(self) -> None:
+
+        start = time.perf_counter()
+
+        records = await self.bot.db.fetch("SELECT * FROM guilds")
+        for data in records:
+            guild_config = objects.GuildConfig(bot=self.bot, data=data)
+            self.cache[guild_config.id] = guild_config
+
+        __log__.info(f"[GUILDS] Preloaded {len(records)} configs in {(time.perf_counter() - start) * 1000:.2f}ms.")
 
     async def delete_config(self, guild_id: int) -> None:
 
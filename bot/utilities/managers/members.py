@@ -0,0 +1,114 @@
+# Future
+from __future__ import annotations
+
+# Standard Library
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+# Packages
+from discord.ext import tasks
+
+
+if TYPE_CHECKING:
+    # My stuff
+    from core.bot import Life
+
+__log__: logging.Logger = logging.getLogger("utilities.managers.members")
+
+FLUSH_INTERVAL = 15
+FLUSH_THRESHOLD = 2000
+
+
+class MemberManager:
+
+    def __init__(self, bot: Life) -> None:
+        self.bot: Life = bot
+
+        # (user_id, guild_id) -> [xp delta, coins delta]
+        self.pending: dict[tuple[int, int], list[int]] = {}
+
+        self.lock: asyncio.Lock = asyncio.Lock()
+        self._threshold_flush: asyncio.Task[None] | None = None
+
+    # Loop
+
+    def start(self) -> None:
+        self.flush_loop.start()
+
+    async def stop(self) -> None:
+
+        # Cancelling the loop part way through a flush would lose the deltas it had already taken out of pending, so wait
+        # for any running flush to finish first.
+        async with self.lock:
+            self.flush_loop.cancel()
+
+        await self.flush()
+
+    @tasks.loop(seconds=FLUSH_INTERVAL)
+    async def flush_loop(self) -> None:
+        await self.flush()
+
+    # Buffering
+
+    def add(self, user_id: int, guild_id: int, *, xp: int = 0, coins: int = 0) -> None:
+
+        if (deltas := self.pending.get((user_id, guild_id))) is None:
+            self.pending[(user_id, guild_id)] = [xp, coins]
+        else:
+            deltas[0] += xp
+            deltas[1] += coins
+
+        if len(self.pending) >= FLUSH_THRESHOLD and (self._threshold_flush is None or self._threshold_flush.done()):
+            self._threshold_flush = asyncio.create_task(self.flush())
+
+    async def set(self, user_id: int, guild_id: int, *, xp: int | None = None, coins: int | None = None) -> None:
+
+        # Absolute writes go straight to the database. Holding the lock stops an in-flight flush from applying older
+        # deltas on top of the new value, and the pending delta for whatever is being overwritten is dropped.
+        async with self.lock:
+
+            if (deltas := self.pending.get((user_id, guild_id))) is not None:
+                if xp is not None:
+                    deltas[0] = 0
+                if coins is not None:
+                    deltas[1] = 0
+
+            await self.bot.db.execute(
+                "UPDATE members SET xp = coalesce($1, xp), coins = coalesce($2, coins) WHERE user_id = $3 AND guild_id = $4",
+                xp,
+                coins,
+                user_id,
+                guild_id,
+            )
+
+    async def flush(self) -> None:
+
+        async with self.lock:
+
+            if not self.pending:
+                return
+
+            pending, self.pending = self.pending, {}
+            pending = {key: deltas for key, deltas in pending.items() if deltas != [0, 0]}
+            if not pending:
+                return
+
+            try:
+                await self.bot.db.execute(
+                    "UPDATE members SET xp = members.xp + data.xp, coins = members.coins + data.coins "
+                    "FROM unnest($1::bigint[], $2::bigint[], $3::bigint[], $4::bigint[]) AS data(user_id, guild_id, xp, coins) "
+                    "WHERE members.user_id = data.user_id AND members.guild_id = data.guild_id",
+                    [user_id for user_id, _ in pending],
+                    [guild_id for _, guild_id in pending],
+                    [xp for xp, _ in pending.values()],
+                    [coins for _, coins in pending.values()],
+                )
+            except Exception as error:
+                # Merge the deltas back in so that they are retried on the next flush rather than lost.
+                for (user_id, guild_id), (xp, coins) in pending.items():
+                    self.add(user_id, guild_id, xp=xp, coins=coins)
+                __log__.error(f"[MEMBERS] Failed to flush xp/coin changes for {len(pending)} members.", exc_info=error)
+                return
+
+        __log__.debug(f"[MEMBERS] Flushed xp/coin changes for {len(pending)} members.")
@@ -0,0 +1,138 @@
+# Future
+from __future__ import annotations
+
+# Standard Library
+import bisect
+import functools
+import logging
+import time
+from typing import TYPE_CHECKING
+
+# My stuff
+from utilities import cache
+
+
+if TYPE_CHECKING:
+    # My stuff
+    from core.bot import Life
+
+__log__: logging.Logger = logging.getLogger("utilities.managers.ranks")
+
+# Rough per-member cost of an index entry; a tuple of two ints in the sorted list plus a dict entry.
+ENTRY_SIZE = 200
+
+
+class GuildRanks:
+
+    def __init__(self, guild_id: int, members: dict[int, int]) -> None:
+
+        self.guild_id: int = guild_id
+
+        # user_id -> xp, and a list of (-xp, -user_id) kept sorted so that a members rank is its position in the list.
+        # Ties are ordered the same way as the leaderboard queries (xp DESC, user_id DESC).
+        self._xp: dict[int, int] = members
+        self._entries: list[tuple[int, int]] = sorted((-xp, -user_id) for user_id, xp in members.items())
+
+    def __repr__(self) -> str:
+        return f"<GuildRanks guild_id={self.guild_id}, size={len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self._xp)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._xp
+
+    @property
+    def size(self) -> int:
+        return len(self) * ENTRY_SIZE
+
+    def update(self, user_id: int, xp: int) -> None:
+
+        if (old := self._xp.get(user_id)) is not None:
+            if old == xp:
+                return
+            del self._entries[bisect.bisect_left(self._entries, (-old, -user_id))]
+
+        self._xp[user_id] = xp
+        bisect.insort(self._entries, (-xp, -user_id))
+
+    def remove(self, user_id: int) -> None:
+
+        if (old := self._xp.pop(user_id, None)) is None:
+            return
+
+        del self._entries[bisect.bisect_left(self._entries, (-old, -user_id))]
+
+    def rank(self, user_id: int) -> int | None:
+
+        if (xp := self._xp.get(user_id)) is None:
+            return None
+
+        return bisect.bisect_left(self._entries, (-xp, -user_id)) + 1
+
+
+class RankManager:
+
+    def __init__(self, bot: Life) -> None:
+        self.bot: Life = bot
+
+        self.cache: cache.LRUCache[int, GuildRanks] = cache.LRUCache(
+            name="ranks",
+            max_size=1000,
+            max_bytes=128 * (2 ** 20),
+            sizeof=lambda ranks: ranks.size,
+        )
+        self._builds: cache.SingleFlight[int, GuildRanks] = cache.SingleFlight()
+
+        # guild_id -> {user_id: xp} for changes made while that guilds index is being built, these are applied on top of
+        # the rows loaded from the database once the build finishes so that they aren't lost. None marks a removal.
+        self._building: dict[int, dict[int, int | None]] = {}
+
+    async def build(self, guild_id: int) -> GuildRanks:
+
+        start = time.perf_counter()
+        self._building[guild_id] = {}
+
+        try:
+            await self.bot.member_manager.flush()
+            records = await self.bot.db.fetch("SELECT user_id, xp FROM members WHERE guild_id = $1", guild_id)
+        finally:
+            changes = self._building.pop(guild_id)
+
+        members = {record["user_id"]: record["xp"] for record in records}
+        for user_id, xp in changes.items():
+            if xp is None:
+                members.pop(user_id, None)
+            else:
+                members[user_id] = xp
+
+        ranks = GuildRanks(guild_id, members)
+        self.cache[guild_id] = ranks
+
+        __log__.debug(f"[RANKS] Built rank index for guild '{guild_id}' with {len(ranks)} members in {(time.perf_counter() - start) * 1000:.2f}ms.")
+        return ranks
+
+    async def get_ranks(self, guild_id: int) -> GuildRanks:
+
+        if (ranks := self.cache.get(guild_id)) is not None:
+            return ranks
+
+        return await self._builds.do(guild_id, functools.partial(self.build, guild_id))
+
+    def update(self, user_id: int, guild_id: int, *, xp: int) -> None:
+
+        # Guilds that haven't been indexed are left alone, they'll be built from the database when they're first needed.
+        if (changes := self._building.get(guild_id)) is not None:
+            changes[user_id] = xp
+        elif (ranks := self.cache.peek(guild_id)) is not None:
+            ranks.update(user_id, xp)
+
+    def remove(self, user_id: int, guild_id: int) -> None:
+
+        if (changes := self._building.get(guild_id)) is not None:
+            changes[user_id] = None
+        elif (ranks := self.cache.peek(guild_id)) is not None:
+            ranks.remove(user_id)
+
+    async def rank(self, user_id: int, guild_id: int) -> int | None:
+        return (await self.get_ranks(guild_id)).rank(user_id)
@@ -2,25 +2,22 @@
 from __future__ import annotations
 
 # Standard Library
+import asyncio
+import functools
 import io
 import logging
 import math
-import os
-import pathlib
-import random
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 # Packages
 import asyncpg
 import discord
 import pendulum
-from colorthief import ColorThief
 from pendulum.tz.timezone import Timezone
-from PIL import Image, ImageDraw, ImageFont
 
 # My stuff
 from core import colours, emojis
-from utilities import exceptions, objects, utils
+from utilities import cache, exceptions, objects, renderers, templates, utils
 
 
 if TYPE_CHECKING:
@@ -29,32 +26,10 @@ if TYPE_CHECKING:
 
 __log__: logging.Logger = logging.getLogger("utilities.managers.users")
 
-IMAGES = {
-    "SAI": {
-        "level_cards": [
-            pathlib.Path("./resources/SAI/level_cards/1.png"),
-            pathlib.Path("./resources/SAI/level_cards/2.png"),
-            pathlib.Path("./resources/SAI/level_cards/3.png"),
-            pathlib.Path("./resources/SAI/level_cards/4.png"),
-            pathlib.Path("./resources/SAI/level_cards/5.png"),
-            pathlib.Path("./resources/SAI/level_cards/6.png"),
-            pathlib.Path("./resources/SAI/level_cards/7.png"),
-            pathlib.Path("./resources/SAI/level_cards/8.png"),
-            pathlib.Path("./resources/SAI/level_cards/9.png"),
-        ],
-        "leaderboard": [
-            pathlib.Path("./resources/SAI/leaderboard/1.png"),
-            pathlib.Path("./resources/SAI/leaderboard/2.png"),
-            pathlib.Path("./resources/SAI/leaderboard/3.png"),
-            pathlib.Path("./resources/SAI/leaderboard/4.png"),
-            pathlib.Path("./resources/SAI/leaderboard/5.png"),
-            pathlib.Path("./resources/SAI/leaderboard/6.png"),
-        ],
-    }
-}
-
-ARIAL_FONT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../resources/fonts/arial.ttf"))
-KABEL_BLACK_FONT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../resources/fonts/kabel_black.otf"))
+LEADERBOARD_PAGE_TTL = 30
+LEADERBOARD_CURSOR_TTL = 600
+MEMBER_COUNT_TTL = 300
+LEVEL_CARD_TTL = 60 * 60 * 24
 
 
 class UserManager:
@@ -62,7 +37,52 @@ class UserManager:
     def __init__(self, bot: Life) -> None:
         self.bot: Life = bot
 
-        self.cache: dict[int, objects.UserConfig] = {}
+        self.cache: cache.LRUCache[int, objects.UserConfig] = cache.LRUCache(
+            name="users",
+            max_size=50_000,
+            max_bytes=256 * (2 ** 20),
+            sizeof=functools.partial(cache.approximate_size, exclude=(bot,)),
+            pinned=self._has_scheduled_reminders,
+        )
+        self._fetches: cache.SingleFlight[int, objects.UserConfig] = cache.SingleFlight()
+
+        self.blacklist: set[int] = set()
+
+        # Leaderboard pages are cached under the guilds current leaderboard version, which is bumped whenever xp changes
+        # in that guild so that stale pages are never read. The (xp, user_id) of the last member on each page is kept
+        # across versions, a keyset on it stays ordered correctly however xp has changed since, and the ranks on pages
+        # read from one are counted rather than taken from the pages position.
+        self.leaderboard_pages: cache.LRUCache[tuple[int, int, int, int], list[dict[str, int]]] = cache.LRUCache(
+            name="lb pages",
+            max_size=5000,
+            ttl=LEADERBOARD_PAGE_TTL,
+        )
+        self.leaderboard_cursors: cache.LRUCache[tuple[int, int, int], tuple[int, int]] = cache.LRUCache(
+            name="lb cursors",
+            max_size=50_000,
+            ttl=LEADERBOARD_CURSOR_TTL,
+        )
+        self.member_counts: cache.LRUCache[int, int] = cache.LRUCache(
+            name="lb counts",
+            max_size=25_000,
+            ttl=MEMBER_COUNT_TTL,
+        )
+        self._leaderboard_versions: dict[int, int] = {}
+
+        # Rendered level card key -> url of the uploaded card.
+        self.level_cards: cache.LRUCache[tuple[Any, ...], str] = cache.LRUCache(
+            name="level cards",
+            max_size=10_000,
+            ttl=LEVEL_CARD_TTL,
+            sizeof=lambda _: 0,
+        )
+        self._level_card_renders: cache.SingleFlight[tuple[Any, ...], str] = cache.SingleFlight()
+
+    @staticmethod
+    def _has_scheduled_reminders(user_config: objects.UserConfig) -> bool:
+        # Reminders only exist as tasks on the scheduler while their user config is alive, so evicting a user with a
+        # pending reminder would silently drop it.
+        return any(reminder.task is not None and not reminder.done for reminder in (user_config.reminders or {}).values())
 
     async def fetch_config(
         self,
@@ -73,11 +93,6 @@ class UserManager:
         data = await self.bot.db.fetchrow("INSERT INTO users (id) VALUES ($1) ON CONFLICT (id) DO UPDATE SET id = excluded.id RETURNING *", user_id)
         user_config = objects.UserConfig(bot=self.bot, data=data)
 
-        await user_config.fetch_notifications()
-        await user_config.fetch_todos()
-        await user_config.fetch_reminders()
-        await user_config.fetch_member_configs()
-
         self.cache[user_config.id] = user_config
 
         __log__.debug(f"[USERS] Cached config for '{user_id}'.")
@@ -92,7 +107,7 @@ class UserManager:
         if (user_config := self.cache.get(user_id)) is not None:
             return user_config
 
-        return await self.fetch_config(user_id)
+        return await self._fetches.do(user_id, functools.partial(self.fetch_config, user_id))
 
     async def delete_config(
         self,
@@ -106,8 +121,53 @@ class UserManager:
         except KeyError:
             pass
 
+        self.blacklist.discard(user_id)
+
+        # Their member rows are deleted along with them, so buffered xp/coin changes must not be applied to rows that
+        # are created for them later.
+        for key in [key for key in self.bot.member_manager.pending if key[0] == user_id]:
+            del self.bot.member_manager.pending[key]
+
         __log__.info(f"[USERS] Deleted config for '{user_id}'.")
 
+    async def load_blacklist(self) -> None:
+
+        records = await self.bot.db.fetch("SELECT id FROM users WHERE blacklisted IS TRUE")
+        self.blacklist = {record["id"] for record in records}
+
+        __log__.info(f"[USERS] Loaded blacklist ({len(self.blacklist)} users).")
+
+    async def schedule_reminders(self) -> None:
+
+        # Reminders are loaded lazily, so users with pending reminders need their reminders loaded up front for them
+        # to be scheduled at all.
+        records = await self.bot.db.fetch(
+            "SELECT * FROM reminders WHERE user_id IN (SELECT DISTINCT user_id FROM reminders WHERE datetime > $1)",
+            pendulum.now(tz="UTC"),
+        )
+
+        reminders: dict[int, list[asyncpg.Record]] = {}
+        for record in records:
+            reminders.setdefault(record["user_id"], []).append(record)
+
+        # Users that aren't cached yet are loaded in one query rather than an upsert each. Their reminders are cached
+        # before they go into the cache so that they're pinned and can't be evicted by the rest being loaded.
+        user_records = await self.bot.db.fetch(
+            "SELECT * FROM users WHERE id = ANY($1::bigint[])",
+            [user_id for user_id in reminders if user_id not in self.cache],
+        )
+        for data in user_records:
+            user_config = objects.UserConfig(bot=self.bot, data=data)
+            user_config.cache_reminders(reminders[user_config.id])
+            self.cache[user_config.id] = user_config
+
+        for user_id, user_reminders in reminders.items():
+            user_config = await self.get_config(user_id)
+            if user_config.reminders is None:
+                user_config.cache_reminders(user_reminders)
+
+        __log__.info(f"[USERS] Scheduled pending reminders for {len(reminders)} users.")
+
     #
 
     async def timezones(
@@ -169,16 +229,86 @@ class UserManager:
         *,
         guild_id: int,
         page: int,
-        limit: int | None = 10
-    ) -> list[asyncpg.Record]:
+        limit: int = 10
+    ) -> list[dict[str, int]]:
+
+        version = self._leaderboard_versions.get(guild_id, 0)
+        key = (guild_id, version, limit, page)
+
+        if (records := self.leaderboard_pages.get(key)) is not None:
+            return records
+
+        await self.bot.member_manager.flush()
+
+        # Pages are walked with a keyset on (xp, user_id) starting after the last member of the previous page, so only
+        # the rows on the page itself are read. Jumping straight to a page without a known cursor for the one before it
+        # falls back to an offset once, after which the pages following it can use its cursor.
+        if page == 1:
+            records = await self.bot.db.fetch(
+                "SELECT user_id, xp FROM members WHERE guild_id = $1 ORDER BY xp DESC, user_id DESC LIMIT $2",
+                guild_id,
+                limit,
+            )
+            first_rank = 1
+        elif (cursor := self.leaderboard_cursors.get((guild_id, limit, page - 1))) is not None:
+            records = await self.bot.db.fetch(
+                "SELECT user_id, xp FROM members WHERE guild_id = $1 AND (xp, user_id) < ($2, $3) ORDER BY xp DESC, user_id DESC LIMIT $4",
+                guild_id,
+                *cursor,
+                limit,
+            )
+            first_rank = await self.leaderboard_rank(guild_id, user_id=records[0]["user_id"], xp=records[0]["xp"]) if records else 1
+        else:
+            records = await self.bot.db.fetch(
+                "SELECT user_id, xp FROM members WHERE guild_id = $1 ORDER BY xp DESC, user_id DESC LIMIT $2 OFFSET $3",
+                guild_id,
+                limit,
+                (page - 1) * limit,
+            )
+            first_rank = (page - 1) * limit + 1
+
+        records = [
+            {"user_id": record["user_id"], "xp": record["xp"], "rank": first_rank + index}
+            for index, record in enumerate(records)
+        ]
 
-        data = await self.bot.db.fetch(
-            "SELECT user_id, xp, row_number() OVER (ORDER BY xp DESC) AS rank FROM members WHERE guild_id = $1 ORDER BY xp DESC LIMIT $2 OFFSET $3",
+        self.leaderboard_pages[key] = records
+        if records:
+            self.leaderboard_cursors[(guild_id, limit, page)] = (records[-1]["xp"], records[-1]["user_id"])
+
+        return records
+
+    async def leaderboard_rank(self, guild_id: int, /, *, user_id: int, xp: int) -> int:
+
+        # Used where the rank is needed without a page (or a cursor page, which can start anywhere). Uses the rank index
+        # if this guild already has one, otherwise counts the members ahead in one query rather than loading the whole
+        # guild into a new index.
+        if (ranks := self.bot.rank_manager.cache.peek(guild_id)) is not None and (rank := ranks.rank(user_id)) is not None:
+            return rank
+
+        ahead = await self.bot.db.fetchval(
+            "SELECT count(*) FROM members WHERE guild_id = $1 AND (xp, user_id) > ($2, $3)",
             guild_id,
-            limit,
-            (page - 1) * (limit or 0),
+            xp,
+            user_id,
         )
-        return data
+        return ahead + 1
+
+    def invalidate_leaderboard(self, guild_id: int, /) -> None:
+        self._leaderboard_versions[guild_id] = self._leaderboard_versions.get(guild_id, 0) + 1
+
+    async def member_count(self, guild_id: int, /) -> int:
+
+        if (ranks := self.bot.rank_manager.cache.peek(guild_id)) is not None:
+            return len(ranks)
+
+        if (count := self.member_counts.get(guild_id)) is not None:
+            return count
+
+        count = await self.bot.db.fetchval("SELECT count(*) FROM members WHERE guild_id = $1", guild_id)
+        self.member_counts[guild_id] = count
+
+        return count
 
     async def rank(
         self,
@@ -187,9 +317,15 @@ class UserManager:
         guild_id: int,
     ) -> int:
 
+        if (rank := await self.bot.rank_manager.rank(user_id, guild_id)) is not None:
+            return rank
+
+        # Members missing from the index (e.g. rows created outside of the bot) fall back to ranking them in the database.
+        await self.bot.member_manager.flush()
+
         data = await self.bot.db.fetchrow(
             "SELECT rank "
-            "FROM (SELECT user_id, row_number() OVER (ORDER BY xp DESC) AS rank FROM members WHERE members.guild_id = $1) as guild_members "
+            "FROM (SELECT user_id, row_number() OVER (ORDER BY xp DESC, user_id DESC) AS rank FROM members WHERE members.guild_id = $1) as guild_members "
             "WHERE guild_members.user_id = $2",
             guild_id,
             user_id,
@@ -203,7 +339,7 @@ class UserManager:
         *,
         guild_id: int,
         page: int
-    ) -> io.BytesIO:
+    ) -> tuple[io.BytesIO, str]:
 
         if not (records := await self.leaderboard(guild_id=guild_id, page=page)):
             raise exceptions.EmbedError(
@@ -213,126 +349,50 @@ class UserManager:
             )
 
         guild = self.bot.get_guild(guild_id)
-        data = []
-
-        for record in records:
-
-            if not (person := guild.get_member(record["user_id"])):
-                person = await self.bot.fetch_user(record["user_id"])
-
-            data.append(
-                (
-                    person,
-                    record["xp"],
-                    record["rank"],
-                    io.BytesIO(await (person.display_avatar.replace(format="png", size=256)).read()),
-                )
-            )
-
-        return await self.bot.loop.run_in_executor(None, self.create_leaderboard_image, data)
-
-    # noinspection PyTypeChecker
-    @staticmethod
-    def create_leaderboard_image(
-        data: list[tuple[discord.Member | discord.User, int, int, io.BytesIO]]
-    ) -> io.BytesIO:
-
-        with Image.open(fp=random.choice(IMAGES["SAI"]["leaderboard"])) as image:
-
-            draw = ImageDraw.Draw(im=image)
-            y = 100
-
-            # Title
-
-            title_text = "XP Leaderboard:"
-            title_font = ImageFont.truetype(font=KABEL_BLACK_FONT, size=93)
-            draw.text(xy=(10, 10 - title_font.getoffset(text=title_text)[1]), text=title_text, font=title_font, fill="#1F1E1C")
-
-            # Actual content
-
-            for member, xp, rank, avatar_bytes in data:
-
-                # Avatar
-
-                with Image.open(fp=avatar_bytes) as avatar:
-                    avatar = avatar.resize(size=(80, 80), resample=Image.LANCZOS)
-                    image.paste(im=avatar, box=(10, y), mask=avatar.convert("RGBA"))
 
-                avatar_bytes.close()
+        # People who have left the guild fall back to (cached) users from the API.
+        missing = [record["user_id"] for record in records if guild.get_member(record["user_id"]) is None]
+        users = dict(zip(missing, await asyncio.gather(*(self.bot.avatar_manager.get_user(user_id) for user_id in missing))))
 
-                # Username
+        people = [guild.get_member(record["user_id"]) or users[record["user_id"]] for record in records]
 
-                name_text = f"{getattr(member, 'nick', None) or member.name}"
-                name_fontsize = 45
-                name_font = ImageFont.truetype(font=KABEL_BLACK_FONT, size=name_fontsize)
+        # Avatars are drawn at 80x80, so there's no point fetching them any larger than 128.
+        avatars = await self.bot.avatar_manager.get_avatars((person.display_avatar for person in people), size=128)
 
-                while draw.textsize(text=name_text, font=name_font) > (600, 30):
-                    name_fontsize -= 1
-                    name_font = ImageFont.truetype(font=KABEL_BLACK_FONT, size=name_fontsize)
+        data = [
+            (getattr(person, "nick", None) or person.name, record["xp"], record["rank"], avatar)
+            for person, record, avatar in zip(people, records, avatars)
+        ]
 
-                draw.text(xy=(100, y - name_font.getoffset(text=name_text)[1]), text=name_text, font=name_font, fill="#1F1E1C")
+        image, file_format = await self.bot.render_pool.run(renderers.leaderboard, data)
+        return io.BytesIO(image), file_format
 
-                #
-
-                y += 45
-
-                # Rank
-
-                rank_text = f"#{rank}"
-                rank_fontsize = 40
-                rank_font = ImageFont.truetype(font=KABEL_BLACK_FONT, size=rank_fontsize)
-
-                while draw.textsize(text=rank_text, font=rank_font) > (600, 30):
-                    rank_fontsize -= 1
-                    rank_font = ImageFont.truetype(font=KABEL_BLACK_FONT, size=rank_fontsize)
-
-                draw.text(xy=(100, y - rank_font.getoffset(text=rank_text)[1]), text=rank_text, font=rank_font, fill="#1F1E1C")
-
-                # Xp
-
-                level = utils.level(xp)
-                needed_xp = utils.needed_xp(level, xp)
-
-                xp_text = f"XP: {xp}/{xp + needed_xp}"
-                xp_fontsize = 40
-                xp_font = ImageFont.truetype(font=KABEL_BLACK_FONT, size=xp_fontsize)
-
-                while draw.textsize(text=xp_text, font=xp_font) > (320, 30):
-                    xp_fontsize -= 1
-                    xp_font = ImageFont.truetype(font=KABEL_BLACK_FONT, size=xp_fontsize)
-
-                draw.text(xy=(220, y - xp_font.getoffset(text=xp_text)[1]), text=xp_text, font=xp_font, fill="#1F1E1C")
-
-                # Level
-
-                level_text = f"Level: {level}"
-                level_fontsize = 40
-                level_font = ImageFont.truetype(font=KABEL_BLACK_FONT, size=level_fontsize)
-
-                while draw.textsize(text=level_text, font=level_font) > (150, 30):
-                    level_fontsize -= 1
-                    level_font = ImageFont.truetype(font=KABEL_BLACK_FONT, size=level_fontsize)
-
-                draw.text(xy=(545, y - level_font.getoffset(text=xp_text)[1]), text=level_text, font=level_font, fill="#1F1E1C")
+    #
 
-                #
+    async def level_card_url(
+        self,
+        *,
+        user_id: int,
+        guild_id: int
+    ) -> str:
 
-                y += 45
+        member, data = await self._level_card_data(user_id=user_id, guild_id=guild_id)
 
-            buffer = io.BytesIO()
-            image.save(buffer, "png")
+        # Everything that ends up on the card is part of the key, so a change in xp, rank, name or avatar is a miss
+        # and outdated cards are never served, they just age out of the cache.
+        key = (user_id, guild_id, member.display_avatar.key, *data)
 
-        buffer.seek(0)
-        return buffer
+        if (url := self.level_cards.get(key)) is not None:
+            return url
 
-    #
+        return await self._level_card_renders.do(key, functools.partial(self._upload_level_card, key, member, data))
 
-    async def create_level_card(
+    async def _level_card_data(
         self,
         *,
         user_id: int,
         guild_id: int
-    ) -> io.BytesIO:
+    ) -> tuple[discord.Member, tuple[str, int, int, int, int, int]]:
 
         guild = self.bot.get_guild(guild_id)
         member = guild.get_member(user_id)
@@ -341,84 +401,25 @@ class UserManager:
         member_config = await user_config.get_member_config(guild_id)
 
         rank = await self.rank(user_id=user_id, guild_id=guild_id)
-        avatar_bytes = io.BytesIO(await (member.display_avatar.replace(format="png", size=256)).read())
-
-        return await self.bot.loop.run_in_executor(
-            None,
-            self.create_level_card_image,
-            (member, member_config.xp, member_config.needed_xp, member_config.level, rank, avatar_bytes),
-        )
-
-    # noinspection PyTypeChecker
-    @staticmethod
-    def create_level_card_image(
-        data: tuple[discord.Member, int, int, int, int, io.BytesIO]
-    ) -> io.BytesIO:
-
-        member, xp, needed_xp, level, rank, avatar_bytes = data
-
-        with Image.open(fp=random.choice(IMAGES["SAI"]["level_cards"])) as image:
-
-            draw = ImageDraw.Draw(im=image)
-
-            with Image.open(fp=avatar_bytes) as avatar:
-
-                avatar = avatar.resize(size=(256, 256), resample=Image.LANCZOS) if avatar.size != (256, 256) else avatar
-                image.paste(im=avatar, box=(22, 22), mask=avatar.convert("RGBA"))
-
-                colour = ColorThief(file=avatar_bytes).get_color(quality=1)
 
-            # Username
+        # The template is picked from the user and their level rather than at random so that an unchanged card can be
+        # served from the cache, while still changing as they level up.
+        template = (user_id + member_config.level) % len(templates.IMAGES["SAI"]["level_cards"])
 
-            name_text = member.nick or member.name
-            name_fontsize = 56
-            name_font = ImageFont.truetype(font=KABEL_BLACK_FONT, size=name_fontsize)
+        return member, (member.nick or member.name, member_config.xp, member_config.needed_xp, member_config.level, rank, template)
 
-            while draw.textsize(text=name_text, font=name_font) > (690, 45):
-                name_fontsize -= 1
-                name_font = ImageFont.truetype(font=KABEL_BLACK_FONT, size=name_fontsize)
+    async def _render_level_card(self, member: discord.Member, data: tuple[str, int, int, int, int, int]) -> tuple[bytes, str]:
 
-            draw.text(xy=(300, 22 - name_font.getoffset(text=name_text)[1]), text=name_text, font=name_font, fill=colour)
+        avatar_bytes = await self.bot.avatar_manager.get_avatar(member.display_avatar, size=256)
+        return await self.bot.render_pool.run(renderers.level_card, (*data, member.display_avatar.key, avatar_bytes))
 
-            # Level
+    async def _upload_level_card(self, key: tuple[Any, ...], member: discord.Member, data: tuple[str, int, int, int, int, int]) -> str:
 
-            level_text = f"Level: {level}"
-            level_font = ImageFont.truetype(font=KABEL_BLACK_FONT, size=40)
+        image, file_format = await self._render_level_card(member, data)
+        url = await utils.upload_file(self.bot.session, file_bytes=image, file_format=file_format)
+        self.level_cards[key] = url
 
-            draw.text(xy=(300, 72 - level_font.getoffset(text=level_text)[1]), text=level_text, font=level_font, fill="#1F1E1C")
-
-            # XP
-
-            xp_text = f"XP: {xp} / {xp + needed_xp}"
-            xp_font = ImageFont.truetype(font=KABEL_BLACK_FONT, size=40)
-
-            draw.text(xy=(300, 112 - xp_font.getoffset(text=xp_text)[1]), text=xp_text, font=xp_font, fill="#1F1E1C")
-
-            # XP BAR
-
-            bar_len = 678
-            outline = utils.darken_colour(*colour, factor=0.2)
-
-            draw.rounded_rectangle(xy=((300, 152), (300 + bar_len, 192)), radius=10, outline=outline, fill="#1F1E1C", width=5)
-
-            if xp > 0:
-                filled_len = int(round(bar_len * xp / float(xp + needed_xp)))
-                draw.rounded_rectangle(xy=((300, 152), (300 + filled_len, 192)), radius=10, outline=outline, fill=colour, width=5)
-
-            # Rank
-
-            rank_text = f"#{rank}"
-            rank_font = ImageFont.truetype(font=KABEL_BLACK_FONT, size=110)
-
-            draw.text(xy=(300, 202 - rank_font.getoffset(text=rank_text)[1]), text=rank_text, font=rank_font, fill="#1F1E1C")
-
-            #
-
-            buffer = io.BytesIO()
-            image.save(buffer, "png")
-
-        buffer.seek(0)
-        return buffer
+        return url
 
     #
 
@@ -426,7 +427,7 @@ class UserManager:
         self,
         *,
         guild_id: int
-    ) -> discord.File:
+    ) -> list[discord.File]:
 
         if not (timezones := await self.timezones(guild_id=guild_id)):
             raise exceptions.EmbedError(
@@ -435,34 +436,26 @@ class UserManager:
                 description="No one has set their timezone, or everyone has set them to be private.",
             )
 
-        timezone_avatars = {}
+        timezone_members: dict[str, list[discord.Member]] = {}
 
         for member, timezone, time in timezones:
 
-            avatar_bytes = io.BytesIO(await (member.display_avatar.replace(format="png", size=256)).read())
             timezone = time.format("HH:mm (ZZ)")
 
-            if users := timezone_avatars.get(timezone, []):
+            if users := timezone_members.get(timezone, []):
                 if len(users) > 36:
                     break
-                timezone_avatars[timezone].append(avatar_bytes)
+                timezone_members[timezone].append(member)
             else:
-                timezone_avatars[timezone] = [avatar_bytes]
-
-        buffer = await self.bot.loop.run_in_executor(None, self.create_grid_image, timezone_avatars)
-        file = discord.File(fp=buffer, filename="timecard.png")
-
-        buffer.close()
-        for avatar_bytes in timezone_avatars.values():
-            [buffer.close() for buffer in avatar_bytes]
+                timezone_members[timezone] = [member]
 
-        return file
+        return await self._create_grid(timezone_members, filename="timecard")
 
     async def create_birthday_card(
         self,
         *,
         guild_id: int
-    ) -> discord.File:
+    ) -> list[discord.File]:
 
         if not (birthdays := await self.birthdays(guild_id=guild_id)):
             raise exceptions.EmbedError(
@@ -471,69 +464,38 @@ class UserManager:
                 description="No one has set their birthday, or everyone has set them to be private.",
             )
 
-        birthday_avatars = {}
+        birthday_members: dict[str, list[discord.Member]] = {}
 
         for member, birthday, _, _ in birthdays:
 
-            avatar_bytes = io.BytesIO(await (member.display_avatar.replace(format="png", size=256)).read())
             birthday_month = birthday.format("MMMM")
 
-            if users := birthday_avatars.get(birthday_month, []):
+            if users := birthday_members.get(birthday_month, []):
                 if len(users) > 36:
                     break
-                birthday_avatars[birthday_month].append(avatar_bytes)
+                birthday_members[birthday_month].append(member)
             else:
-                birthday_avatars[birthday_month] = [avatar_bytes]
+                birthday_members[birthday_month] = [member]
 
-        buffer = await self.bot.loop.run_in_executor(None, self.create_grid_image, birthday_avatars)
-        file = discord.File(fp=buffer, filename="birthday.png")
+        return await self._create_grid(birthday_members, filename="birthday")
 
-        buffer.close()
-        for avatar_bytes in birthday_avatars.values():
-            [buffer.close() for buffer in avatar_bytes]
+    async def _create_grid(self, groups: dict[str, list[discord.Member]], *, filename: str) -> list[discord.File]:
 
-        return file
+        # Discord only allows 10 files per message, so groups that would end up on later pages are dropped before any
+        # of their avatars are fetched or drawn.
+        groups = dict(list(groups.items())[:10 * renderers.GRID_COLUMNS * renderers.GRID_ROWS_PER_PAGE])
 
-    # noinspection PyTypeChecker
-    @staticmethod
-    def create_grid_image(
-        data: dict[str, io.BytesIO]
-    ) -> io.BytesIO:
-
-        width_x, height_y = ((1600 * min(len(data), 5)) + 100), ((1800 * math.ceil(len(data) / 5)) + 100)
-
-        with Image.new(mode="RGBA", size=(width_x, height_y), color=colours.MAIN.to_rgb()) as image:
-
-            draw = ImageDraw.Draw(im=image)
-            font = ImageFont.truetype(font=ARIAL_FONT, size=120)
-
-            x, y = 100, 100
-
-            for timezone, avatars in data.items():
-
-                draw.text(xy=(x, y), text=timezone, font=font, fill="#1B1A1C")
-                user_x, user_y = x, y + 200
-
-                for avatar_bytes in avatars:
-
-                    with Image.open(fp=avatar_bytes) as avatar:
-                        avatar = avatar.resize(size=(250, 250), resample=Image.LANCZOS)
-                        image.paste(im=avatar, box=(user_x, user_y), mask=avatar.convert(mode="RGBA"))
-
-                    if user_x < x + 1200:
-                        user_x += 250
-                    else:
-                        user_y += 250
-                        user_x = x
-
-                if x > 6400:
-                    y += 1800
-                    x = 100
-                else:
-                    x += 1600
-
-            buffer = io.BytesIO()
-            image.save(fp=buffer, format="png")
+        # Fetch every avatar in the grid at once rather than one group (and one member) at a time, at the smallest size
+        # discord has that is at least as big as they're drawn.
+        avatars = iter(
+            await self.bot.avatar_manager.get_avatars(
+                (member.display_avatar for members in groups.values() for member in members),
+                size=max(2 ** math.ceil(math.log2(250 * renderers.GRID_SCALE)), 16),
+            )
+        )
+        pages = await self.bot.render_pool.run(renderers.grid, {group: [next(avatars) for _ in members] for group, members in groups.items()})
 
-        buffer.seek(0)
-        return buffer
+        return [
+            discord.File(fp=io.BytesIO(page), filename=f"{filename}-{index}.{file_format}")
+            for index, (page, file_format) in enumerate(pages, start=1)
+        ]
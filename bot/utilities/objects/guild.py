@@ -3,6 +3,7 @@ from __future__ import annotations
 
 # Standard Library
 import logging
+import re
 from typing import TYPE_CHECKING, Any
 
 # Packages
@@ -10,7 +11,8 @@ import pendulum
 import rapidfuzz
 
 # My stuff
-from utilities import enums, objects
+from core import config
+from utilities import cache, enums, objects
 
 
 if TYPE_CHECKING:
@@ -32,8 +34,12 @@ class GuildConfig:
 
         self._embed_size: enums.EmbedSize = enums.EmbedSize(data["embed_size"])
         self._prefixes: list[str] = data["prefixes"]
+        self._prefix_pattern: re.Pattern[str] | None = None
 
-        self._tags: dict[str, objects.Tag] = {}
+        # Tags are loaded on first access through 'get_tags', None means not loaded yet.
+        self._tags: dict[str, objects.Tag] | None = None
+
+        self._fetches: cache.SingleFlight[str, dict[str, objects.Tag]] = cache.SingleFlight()
 
     def __repr__(self) -> str:
         return f"<GuildConfig id={self.id}, prefixes={self.prefixes}, embed_size={self.embed_size}>"
@@ -60,10 +66,21 @@ class GuildConfig:
     def prefixes(self) -> list[str]:
         return self._prefixes
 
+    @property
+    def prefix_pattern(self) -> re.Pattern[str]:
+
+        # Alternatives are tried in the same order as the list built by 'commands.when_mentioned_or', so the matched
+        # prefix is the same one discord.py would have picked from that list.
+        if self._prefix_pattern is None:
+            prefixes = [f"<@{self.bot.user.id}> ", f"<@!{self.bot.user.id}> ", config.PREFIX, "I-", *self.prefixes]
+            self._prefix_pattern = re.compile("|".join(re.escape(prefix) for prefix in prefixes))
+
+        return self._prefix_pattern
+
     #
 
     @property
-    def tags(self) -> dict[str, objects.Tag]:
+    def tags(self) -> dict[str, objects.Tag] | None:
         return self._tags
 
     # Config
@@ -85,24 +102,35 @@ class GuildConfig:
             raise ValueError(f"'change_prefixes' expected one of {enums.Operation.ADD, enums.Operation.REMOVE, enums.Operation.RESET}, got '{operation!r}'.")
 
         self._prefixes = data["prefixes"]
+        self._prefix_pattern = None
 
     # Caching
 
-    async def fetch_tags(self) -> None:
+    async def fetch_tags(self) -> dict[str, objects.Tag]:
 
-        if not (tags := await self.bot.db.fetch("SELECT * FROM tags WHERE guild_id = $1", self.id)):
-            return
+        records = await self.bot.db.fetch("SELECT * FROM tags WHERE guild_id = $1", self.id)
+        self._tags = tags = {}
 
-        for tag_data in tags:
+        for tag_data in records:
             tag = objects.Tag(bot=self.bot, guild_config=self, data=tag_data)
-            self._tags[tag.name] = tag
+            tags[tag.name] = tag
+
+        __log__.debug(f"[GUILDS] Fetched and cached tags ({len(records)}) for '{self.id}'.")
+        return tags
 
-        __log__.debug(f"[GUILDS] Fetched and cached tags ({len(tags)}) for '{self.id}'.")
+    async def get_tags(self) -> dict[str, objects.Tag]:
+
+        if (tags := self._tags) is None:
+            tags = await self._fetches.do("tags", self.fetch_tags)
+
+        return tags
 
     # Tags
 
     async def create_tag(self, *, user_id: int, name: str, content: str, jump_url: str | None = None) -> objects.Tag:
 
+        tags = await self.get_tags()
+
         data = await self.bot.db.fetchrow(
             "INSERT INTO tags (user_id, guild_id, name, content, jump_url) VALUES ($1, $2, $3, $4, $5) RETURNING *",
             user_id,
@@ -113,12 +141,14 @@ class GuildConfig:
         )
 
         tag = objects.Tag(bot=self.bot, guild_config=self, data=data)
-        self._tags[tag.name] = tag
+        tags[tag.name] = tag
 
         return tag
 
     async def create_tag_alias(self, *, user_id: int, name: str, original: int, jump_url: str | None = None) -> objects.Tag:
 
+        tags = await self.get_tags()
+
         data = await self.bot.db.fetchrow(
             "INSERT INTO tags (user_id, guild_id, name, alias, jump_url) VALUES ($1, $2, $3, $4, $5) RETURNING *",
             user_id,
@@ -129,35 +159,40 @@ class GuildConfig:
         )
 
         tag = objects.Tag(bot=self.bot, guild_config=self, data=data)
-        self._tags[tag.name] = tag
+        tags[tag.name] = tag
 
         return tag
 
-    def get_tag(self, *, tag_name: str | None = None, tag_id: int | None = None) -> objects.Tag | None:
+    async def get_tag(self, *, tag_name: str | None = None, tag_id: int | None = None) -> objects.Tag | None:
+
+        tags = await self.get_tags()
 
         if tag_name:
-            tag = self.tags.get(tag_name)
+            tag = tags.get(tag_name)
 
         elif tag_id:
-            if not (tags := [tag for tag in self.tags.values() if tag.id == tag_id]):
+            if not (matches := [tag for tag in tags.values() if tag.id == tag_id]):
                 return None
-            tag = tags[0]
+            tag = matches[0]
 
         else:
             raise ValueError("\"tag_name\" or \"tag_id\" parameter must be specified.")
 
         return tag
 
-    def get_all_tags(self) -> list[objects.Tag] | None:
-        return list(self.tags.values())
+    async def get_all_tags(self) -> list[objects.Tag] | None:
+        return list((await self.get_tags()).values())
+
+    async def get_user_tags(self, user_id: int) -> list[objects.Tag] | None:
+        return [tag for tag in (await self.get_tags()).values() if tag.user_id == user_id]
+
+    async def get_tags_matching(self, name: str, *, limit: int = 5) -> list[objects.Tag] | None:
 
-    def get_user_tags(self, user_id: int) -> list[objects.Tag] | None:
-        return [tag for tag in self.tags.values() if tag.user_id == user_id]
+        tags = await self.get_tags()
 
-    def get_tags_matching(self, name: str, *, limit: int = 5) -> list[objects.Tag] | None:
         return [
-            self.get_tag(tag_name=match)
-            for match, _, _ in rapidfuzz.process.extract(query=name, choices=list(self.tags.keys()), processor=lambda t: t, limit=limit)
+            tags[match]
+            for match, _, _ in rapidfuzz.process.extract(query=name, choices=list(tags.keys()), processor=lambda t: t, limit=limit)
         ]
 
     async def delete_tag(self, *, tag_name: str | None = None, tag_id: int | None = None) -> None:
@@ -165,7 +200,7 @@ class GuildConfig:
         if not tag_name or not tag_id:
             raise ValueError("\"tag_name\" or \"tag_id\" parameter must be specified.")
 
-        if not (tag := self.get_tag(tag_name=tag_name, tag_id=tag_id)):
+        if not (tag := await self.get_tag(tag_name=tag_name, tag_id=tag_id)):
             return
 
         await tag.delete()
@@ -83,7 +83,10 @@ class MemberConfig:
         else:
             raise ValueError(f"'change_coins' expected one of {enums.Operation.SET, enums.Operation.ADD, enums.Operation.MINUS}, got '{operation!r}'.")
 
-        await self.bot.db.execute("UPDATE members SET coins = $1 WHERE user_id = $2 AND guild_id = $3", self.coins, self.user_id, self.guild_id)
+        if operation == enums.Operation.SET:
+            await self.bot.member_manager.set(self.user_id, self.guild_id, coins=self.coins)
+        else:
+            self.bot.member_manager.add(self.user_id, self.guild_id, coins=coins if operation == enums.Operation.ADD else -coins)
 
     async def change_xp(self, xp: int, *, operation: enums.Operation) -> None:
 
@@ -96,4 +99,10 @@ class MemberConfig:
         else:
             raise ValueError(f"'change_xp' expected one of {enums.Operation.SET, enums.Operation.ADD, enums.Operation.MINUS}, got '{operation!r}'.")
 
-        await self.bot.db.execute("UPDATE members SET xp = $1 WHERE user_id = $2 AND guild_id = $3", self.xp, self.user_id, self.guild_id)
+        self.bot.rank_manager.update(self.user_id, self.guild_id, xp=self.xp)
+        self.bot.user_manager.invalidate_leaderboard(self.guild_id)
+
+        if operation == enums.Operation.SET:
+            await self.bot.member_manager.set(self.user_id, self.guild_id, xp=self.xp)
+        else:
+            self.bot.member_manager.add(self.user_id, self.guild_id, xp=xp if operation == enums.Operation.ADD else -xp)
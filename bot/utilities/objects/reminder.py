@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 # Packages
+import asyncpg
 import aioscheduler.task
 import discord
 import pendulum
@@ -40,7 +41,7 @@ REPEAT_TYPES = {
 
 class Reminder:
 
-    def __init__(self, bot: Life, user_config: objects.user.UserConfig, data: dict[str, Any]) -> None:
+    def __init__(self, bot: Life, user_config: objects.user.UserConfig, data: asyncpg.Record) -> None:
 
         self._bot = bot
         self._user_config = user_config
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 # Standard Library
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 # Packages
+import asyncpg
 import pendulum
 
 # My stuff
@@ -18,7 +19,7 @@ if TYPE_CHECKING:
 
 class Todo:
 
-    def __init__(self, bot: Life, user_config: objects.UserConfig, data: dict[str, Any]) -> None:
+    def __init__(self, bot: Life, user_config: objects.UserConfig, data: asyncpg.Record) -> None:
 
         self._bot = bot
         self._user_config = user_config
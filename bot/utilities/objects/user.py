@@ -2,15 +2,17 @@
 from __future__ import annotations
 
 # Standard Library
+import functools
 import logging
 from typing import TYPE_CHECKING, Any
 
 # Packages
+import asyncpg
 import pendulum
 from pendulum.tz.timezone import Timezone
 
 # My stuff
-from utilities import enums, objects
+from utilities import cache, enums, objects
 
 
 if TYPE_CHECKING:
@@ -39,11 +41,16 @@ class UserConfig:
         self._birthday: pendulum.Date | None = pendulum.Date(birthday.year, birthday.month, birthday.day) if (birthday := data["birthday"]) else None
         self._birthday_private: bool = data["birthday_private"]
 
+        # Sub-collections are loaded on first access through their get_* methods, None means not loaded yet. Member
+        # configs are loaded one guild at a time.
         self._notifications: objects.Notifications | None = None
-        self._reminders: dict[int, objects.Reminder] = {}
-        self._todos: dict[int, objects.Todo] = {}
+        self._reminders: dict[int, objects.Reminder] | None = None
+        self._todos: dict[int, objects.Todo] | None = None
         self._member_configs: dict[int, objects.MemberConfig] = {}
 
+        self._fetches: cache.SingleFlight[str, Any] = cache.SingleFlight()
+        self._member_config_fetches: cache.SingleFlight[int, objects.MemberConfig] = cache.SingleFlight()
+
     def __repr__(self) -> str:
         return f"<UserConfig id={self.id}, blacklisted={self.blacklisted} timezone={self.timezone} birthday={self.birthday}>"
 
@@ -88,15 +95,15 @@ class UserConfig:
     #
 
     @property
-    def notifications(self) -> objects.Notifications:
+    def notifications(self) -> objects.Notifications | None:
         return self._notifications
 
     @property
-    def reminders(self) -> dict[int, objects.Reminder]:
+    def reminders(self) -> dict[int, objects.Reminder] | None:
         return self._reminders
 
     @property
-    def todos(self) -> dict[int, objects.Todo]:
+    def todos(self) -> dict[int, objects.Todo] | None:
         return self._todos
 
     @property
@@ -150,6 +157,11 @@ class UserConfig:
         self._blacklisted = data["blacklisted"]
         self._blacklisted_reason = data["blacklisted_reason"]
 
+        if self._blacklisted:
+            self.bot.user_manager.blacklist.add(self.id)
+        else:
+            self.bot.user_manager.blacklist.discard(self.id)
+
     async def set_timezone(self, timezone: Timezone | None = None, *, private: bool | None = None) -> None:
 
         private = self.timezone_private if private is None else private
@@ -178,70 +190,102 @@ class UserConfig:
 
     # Caching
 
-    async def fetch_notifications(self) -> None:
+    async def fetch_notifications(self) -> objects.Notifications:
 
         notification = await self.bot.db.fetchrow(
             "INSERT INTO notifications (user_id) VALUES ($1) ON CONFLICT (user_id) DO UPDATE SET user_id = excluded.user_id RETURNING *",
             self.id,
         )
-        self._notifications = objects.Notifications(bot=self.bot, user_config=self, data=notification)
+        return self.cache_notifications(notification)
+
+    async def fetch_todos(self) -> dict[int, objects.Todo]:
+        return self.cache_todos(await self.bot.db.fetch("SELECT * FROM todos WHERE user_id = $1", self.id))
+
+    async def fetch_reminders(self) -> dict[int, objects.Reminder]:
+        return self.cache_reminders(await self.bot.db.fetch("SELECT * FROM reminders WHERE user_id = $1", self.id))
+
+    def cache_notifications(self, data: asyncpg.Record) -> objects.Notifications:
+
+        self._notifications = notifications = objects.Notifications(bot=self.bot, user_config=self, data=data)
+        self.bot.user_manager.cache.touch(self.id)
 
         __log__.debug(f"[USERS] Fetched and cached notification settings for '{self.id}'.")
+        return notifications
 
-    async def fetch_todos(self) -> None:
+    def cache_todos(self, records: list[asyncpg.Record]) -> dict[int, objects.Todo]:
 
-        if not (todos := await self.bot.db.fetch("SELECT * FROM todos WHERE user_id = $1", self.id)):
-            return
+        self._todos = todos = {}
 
-        for todo_data in todos:
+        for todo_data in records:
             todo = objects.Todo(bot=self.bot, user_config=self, data=todo_data)
-            self._todos[todo.id] = todo
+            todos[todo.id] = todo
 
-        __log__.debug(f"[USERS] Fetched and cached todos ({len(todos)}) for '{self.id}'.")
+        self.bot.user_manager.cache.touch(self.id)
 
-    async def fetch_reminders(self) -> None:
+        __log__.debug(f"[USERS] Fetched and cached todos ({len(records)}) for '{self.id}'.")
+        return todos
 
-        if not (reminders := await self.bot.db.fetch("SELECT * FROM reminders WHERE user_id = $1", self.id)):
-            return
+    def cache_reminders(self, records: list[asyncpg.Record]) -> dict[int, objects.Reminder]:
+
+        if self._reminders is not None:
+            for reminder in self._reminders.values():
+                if reminder.task is not None and not reminder.done:
+                    self.bot.scheduler.cancel(reminder.task)
 
-        for reminder_data in reminders:
+        self._reminders = reminders = {}
+
+        for reminder_data in records:
 
             reminder = objects.Reminder(bot=self.bot, user_config=self, data=reminder_data)
             if not reminder.done:
                 reminder.schedule()
 
-            self._reminders[reminder.id] = reminder
+            reminders[reminder.id] = reminder
 
-        __log__.debug(f"[USERS] Fetched and cached reminders ({len(reminders)}) for '{self.id}'.")
+        self.bot.user_manager.cache.touch(self.id)
 
-    async def fetch_member_configs(self) -> None:
+        __log__.debug(f"[USERS] Fetched and cached reminders ({len(records)}) for '{self.id}'.")
+        return reminders
 
-        if not (member_configs := await self.bot.db.fetch("SELECT * FROM members WHERE user_id = $1", self.id)):
-            return
+    async def get_notifications(self) -> objects.Notifications:
+
+        if (notifications := self._notifications) is None:
+            notifications = await self._fetches.do("notifications", self.fetch_notifications)
 
-        for member_config_data in member_configs:
-            member_config = objects.MemberConfig(user_config=self, data=member_config_data)
-            self._member_configs[member_config.guild_id] = member_config
+        return notifications
 
-        __log__.debug(f"[USERS] Fetched and cached member configs ({len(member_configs)}) for '{self.id}'.")
+    async def get_todos(self) -> dict[int, objects.Todo]:
+
+        if (todos := self._todos) is None:
+            todos = await self._fetches.do("todos", self.fetch_todos)
+
+        return todos
+
+    async def get_reminders(self) -> dict[int, objects.Reminder]:
+
+        if (reminders := self._reminders) is None:
+            reminders = await self._fetches.do("reminders", self.fetch_reminders)
+
+        return reminders
 
     # Todos
 
     async def create_todo(self, *, content: str, jump_url: str | None = None) -> objects.Todo:
 
+        todos = await self.get_todos()
         data = await self.bot.db.fetchrow("INSERT INTO todos (user_id, content, jump_url) VALUES ($1, $2, $3) RETURNING *", self.id, content, jump_url)
 
         todo = objects.Todo(bot=self.bot, user_config=self, data=data)
-        self._todos[todo.id] = todo
+        todos[todo.id] = todo
 
         return todo
 
-    def get_todo(self, todo_id: int) -> objects.Todo | None:
-        return self.todos.get(todo_id)
+    async def get_todo(self, todo_id: int) -> objects.Todo | None:
+        return (await self.get_todos()).get(todo_id)
 
     async def delete_todo(self, todo_id: int) -> None:
 
-        if not (todo := self.get_todo(todo_id)):
+        if not (todo := await self.get_todo(todo_id)):
             return
 
         await todo.delete()
@@ -258,6 +302,9 @@ class UserConfig:
         repeat_type: enums.ReminderRepeatType = enums.ReminderRepeatType.NEVER,
     ) -> objects.Reminder:
 
+        # Load existing reminders first, loading them afterwards would schedule this one a second time.
+        reminders = await self.get_reminders()
+
         data = await self.bot.db.fetchrow(
             "INSERT INTO reminders (user_id, channel_id, datetime, content, jump_url, repeat_type) VALUES ($1, $2, $3, $4, $5, $6) RETURNING *",
             self.id,
@@ -269,19 +316,19 @@ class UserConfig:
         )
 
         reminder = objects.Reminder(bot=self.bot, user_config=self, data=data)
-        self._reminders[reminder.id] = reminder
+        reminders[reminder.id] = reminder
 
         if not reminder.done:
             reminder.schedule()
 
         return reminder
 
-    def get_reminder(self, reminder_id: int) -> objects.Reminder | None:
-        return self.reminders.get(reminder_id)
+    async def get_reminder(self, reminder_id: int) -> objects.Reminder | None:
+        return (await self.get_reminders()).get(reminder_id)
 
     async def delete_reminder(self, reminder_id: int) -> None:
 
-        if not (reminder := self.get_reminder(reminder_id)):
+        if not (reminder := await self.get_reminder(reminder_id)):
             return
 
         await reminder.delete()
@@ -290,14 +337,29 @@ class UserConfig:
 
     async def fetch_member_config(self, guild_id: int) -> objects.MemberConfig:
 
-        data = await self.bot.db.fetchrow(
-            "INSERT INTO members (user_id, guild_id) VALUES ($1, $2) ON CONFLICT (user_id, guild_id) DO UPDATE SET user_id = excluded.user_id RETURNING *",
-            self.id,
-            guild_id,
-        )
+        # xp and coin changes are buffered by the member manager, so the row can be behind if this config was evicted
+        # before they were flushed. Holding its lock means any deltas are either still pending or already in the row.
+        async with self.bot.member_manager.lock:
+
+            data = dict(
+                await self.bot.db.fetchrow(
+                    "INSERT INTO members (user_id, guild_id) VALUES ($1, $2) ON CONFLICT (user_id, guild_id) DO UPDATE SET user_id = excluded.user_id RETURNING *",
+                    self.id,
+                    guild_id,
+                )
+            )
+
+            if (deltas := self.bot.member_manager.pending.get((self.id, guild_id))) is not None:
+                data["xp"] += deltas[0]
+                data["coins"] += deltas[1]
+
         member_config = objects.MemberConfig(user_config=self, data=data)
 
         self._member_configs[member_config.guild_id] = member_config
+        self.bot.user_manager.cache.touch(self.id)
+        self.bot.rank_manager.update(self.id, guild_id, xp=member_config.xp)
+        self.bot.user_manager.member_counts.pop(guild_id)
+        self.bot.user_manager.invalidate_leaderboard(guild_id)
 
         __log__.debug(f"[USERS] Cached member config for user '{self.id}' in guild '{guild_id}'.")
         return member_config
@@ -307,11 +369,15 @@ class UserConfig:
         if (member_config := self._member_configs.get(guild_id)) is not None:
             return member_config
 
-        return await self.fetch_member_config(guild_id)
+        return await self._member_config_fetches.do(guild_id, functools.partial(self.fetch_member_config, guild_id))
 
     async def delete_config(self, guild_id: int) -> None:
 
         await self.bot.db.execute("DELETE FROM members WHERE user_id = $1 AND guild_id = $2", self.id, guild_id)
+        self.bot.member_manager.pending.pop((self.id, guild_id), None)
+        self.bot.rank_manager.remove(self.id, guild_id)
+        self.bot.user_manager.member_counts.pop(guild_id)
+        self.bot.user_manager.invalidate_leaderboard(guild_id)
         try:
             del self._member_configs[guild_id]
         except KeyError:
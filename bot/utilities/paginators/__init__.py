@@ -7,4 +7,5 @@ from utilities.paginators.embed import EmbedPaginator
 from utilities.paginators.embeds import EmbedsPaginator
 from utilities.paginators.fields import FieldsPaginator
 from utilities.paginators.file import FilePaginator
+from utilities.paginators.lazy_text import LazyTextPaginator
 from utilities.paginators.text import TextPaginator
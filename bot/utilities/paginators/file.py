@@ -2,12 +2,23 @@
 from __future__ import annotations
 
 # Standard Library
+import asyncio
+import collections
 import functools
 
 # My stuff
 from utilities import custom, paginators, utils
 
 
+PREFETCH_CACHE_SIZE = 5
+
+
+def _consume_exception(task: asyncio.Task[str]) -> None:
+    # Prefetched pages that fail might never be awaited, this stops their exceptions from being logged as unretrieved.
+    if not task.cancelled():
+        task.exception()
+
+
 class FilePaginator(paginators.BasePaginator):
 
     def __init__(
@@ -26,13 +37,59 @@ class FilePaginator(paginators.BasePaginator):
 
         self.current_page: str | None = None
 
+        # page -> task that renders and uploads it, most recently used last. The pages either side of the current one
+        # are rendered in the background so that they're usually ready by the time they're clicked.
+        self._pages: collections.OrderedDict[int, asyncio.Task[str]] = collections.OrderedDict()
+
+    # Rendering
+
+    async def _render(self, page: int) -> str:
+
+        buffer, file_format = await self.entries[page]()
+        url = await utils.upload_file(self.ctx.bot.session, file_bytes=buffer, file_format=file_format)
+        buffer.close()
+
+        return url
+
+    def _get_page(self, page: int) -> asyncio.Task[str]:
+
+        task = self._pages.get(page)
+
+        # Pages that failed or were cancelled are retried rather than served from the cache.
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            task = asyncio.create_task(self._render(page))
+            task.add_done_callback(_consume_exception)
+            self._pages[page] = task
+
+        self._pages.move_to_end(page)
+        return task
+
+    def _prefetch(self, page: int) -> None:
+
+        for adjacent in (page + 1, page - 1):
+            if 0 <= adjacent < len(self.pages):
+                self._get_page(adjacent)
+
+        while len(self._pages) > PREFETCH_CACHE_SIZE:
+            _, task = self._pages.popitem(last=False)
+            task.cancel()
+
+    # Overridden
+
+    async def stop(self) -> None:
+
+        for task in self._pages.values():
+            task.cancel()
+        self._pages.clear()
+
+        await super().stop()
+
     # Abstract methods
 
     async def set_page(self, *, page: int) -> None:
 
-        buffer = await self.entries[page]()
-        url = await utils.upload_file(self.ctx.bot.session, file_bytes=buffer, file_format="png")
-        buffer.close()
+        url = await asyncio.shield(self._get_page(page))
+        self._prefetch(page)
 
         self.current_page = f"{self.header}{url}"
 
@@ -0,0 +1,45 @@
+# Future
+from __future__ import annotations
+
+# Standard Library
+import functools
+
+# My stuff
+from utilities import custom, paginators
+
+
+class LazyTextPaginator(paginators.BasePaginator):
+
+    def __init__(
+        self,
+        *,
+        ctx: custom.Context,
+        entries: list[functools.partial],
+        timeout: int = 300,
+        delete_message: bool = False,
+        codeblock: bool = False,
+        header: str | None = None,
+        footer: str | None = None,
+    ) -> None:
+
+        super().__init__(ctx=ctx, entries=entries, per_page=1, timeout=timeout, delete_message=delete_message, codeblock=codeblock)
+
+        self.header: str = header or ""
+        self.footer: str = footer or ""
+
+        self.current_page: str | None = None
+
+    # Abstract methods
+
+    async def set_page(self, *, page: int) -> None:
+        self.current_page = f"{self.CODEBLOCK_START}{self.header}{await self.entries[page]()}{self.footer}{self.CODEBLOCK_END}"
+
+    async def change_page(self, *, page: int) -> None:
+
+        await super().change_page(page=page)
+        await self.message.edit(content=self.current_page, view=self.view)
+
+    async def paginate(self) -> None:
+
+        await self.set_page(page=self.page)
+        self.message = await self.ctx.reply(content=self.current_page, view=self.view)
@@ -0,0 +1,42 @@
+# Future
+from __future__ import annotations
+
+# Packages
+import numpy
+from PIL import Image
+
+
+def dominant_colour(image: Image.Image, *, size: int = 64, bits: int = 4) -> tuple[int, int, int]:
+    """
+    Returns the dominant colour of an image as an (r, g, b) tuple.
+
+    The image is shrunk to at most ``size`` x ``size``, its pixels are bucketed by the top ``bits`` bits of each channel,
+    and the average colour of the most common group of neighbouring buckets is returned. Mostly transparent and near white pixels are ignored,
+    the same as ColorThief does.
+    """
+
+    with image.convert("RGBA") as thumbnail:
+        thumbnail.thumbnail((size, size))
+        pixels = numpy.asarray(thumbnail, dtype=numpy.uint8).reshape(-1, 4)
+
+    rgb = pixels[(pixels[:, 3] >= 125) & ~(pixels[:, :3] > 250).all(axis=1), :3]
+    if not len(rgb):
+        rgb = pixels[:, :3]
+
+    # Bucket the pixels and pick the bucket with the most pixels in and around it, counting neighbouring buckets stops a
+    # colour that happens to straddle a bucket boundary from losing out to a smaller one that doesn't.
+    buckets = (rgb >> (8 - bits)).astype(numpy.int32)
+    length = 1 << bits
+
+    counts = numpy.zeros((length + 2,) * 3, dtype=numpy.int32)
+    numpy.add.at(counts, (buckets[:, 0] + 1, buckets[:, 1] + 1, buckets[:, 2] + 1), 1)
+
+    neighbourhoods = sum(
+        counts[1 + x:length + 1 + x, 1 + y:length + 1 + y, 1 + z:length + 1 + z]
+        for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)
+    )
+    peak = numpy.array(numpy.unravel_index(neighbourhoods.argmax(), neighbourhoods.shape))
+
+    red, green, blue = rgb[(numpy.abs(buckets - peak) <= 1).all(axis=1)].mean(axis=0).round().astype(int)
+
+    return int(red), int(green), int(blue)
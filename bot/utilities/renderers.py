@@ -0,0 +1,201 @@
+# Future
+from __future__ import annotations
+
+# Standard Library
+import io
+import math
+import random
+
+# Packages
+from PIL import Image, ImageDraw
+
+# My stuff
+from core import colours
+from utilities import cache, encoders, fonts, palette, templates, utils
+
+
+# Renderers run in the render worker pool, so they take and return plain data (names, numbers and image bytes) that can
+# be pickled, rather than discord objects.
+
+# avatar key -> dominant colour, kept per worker.
+AVATAR_COLOURS: cache.LRUCache[str, tuple[int, int, int]] = cache.LRUCache(name="avatar colours", max_size=4096, sizeof=lambda _: 0)
+
+# Groups per row of a grid image, rows per page, and the size pages are drawn at relative to 1600x1800 pixels per group.
+GRID_COLUMNS = 5
+GRID_ROWS_PER_PAGE = 2
+GRID_SCALE = 0.5
+
+
+def initialise() -> None:
+    # Runs once in every render worker as it starts, so that the first render in each one doesn't pay for decoding the
+    # templates.
+    templates.preload()
+
+
+# noinspection PyTypeChecker
+def leaderboard(
+    data: list[tuple[str, int, int, bytes]]
+) -> tuple[bytes, str]:
+
+    # The template already has the title drawn on it.
+    with templates.leaderboard(random.randrange(len(templates.IMAGES["SAI"]["leaderboard"]))).copy() as image:
+
+        draw = ImageDraw.Draw(im=image)
+        y = 100
+
+        for name_text, xp, rank, avatar_bytes in data:
+
+            # Avatar
+
+            with Image.open(fp=io.BytesIO(avatar_bytes)) as avatar:
+                avatar = avatar.resize(size=(80, 80), resample=Image.LANCZOS)
+                image.paste(im=avatar, box=(10, y), mask=avatar.convert("RGBA"))
+
+            # Username
+
+            name_font = fonts.fit(name_text, path=fonts.KABEL_BLACK, size=45, bounds=(600, 30))
+
+            draw.text(xy=(100, y - name_font.getoffset(text=name_text)[1]), text=name_text, font=name_font, fill="#1F1E1C")
+
+            #
+
+            y += 45
+
+            # Rank
+
+            rank_text = f"#{rank}"
+            rank_font = fonts.fit(rank_text, path=fonts.KABEL_BLACK, size=40, bounds=(600, 30))
+
+            draw.text(xy=(100, y - rank_font.getoffset(text=rank_text)[1]), text=rank_text, font=rank_font, fill="#1F1E1C")
+
+            # Xp
+
+            level = utils.level(xp)
+            needed_xp = utils.needed_xp(level, xp)
+
+            xp_text = f"XP: {xp}/{xp + needed_xp}"
+            xp_font = fonts.fit(xp_text, path=fonts.KABEL_BLACK, size=40, bounds=(320, 30))
+
+            draw.text(xy=(220, y - xp_font.getoffset(text=xp_text)[1]), text=xp_text, font=xp_font, fill="#1F1E1C")
+
+            # Level
+
+            level_text = f"Level: {level}"
+            level_font = fonts.fit(level_text, path=fonts.KABEL_BLACK, size=40, bounds=(150, 30))
+
+            draw.text(xy=(545, y - level_font.getoffset(text=xp_text)[1]), text=level_text, font=level_font, fill="#1F1E1C")
+
+            #
+
+            y += 45
+
+        return encoders.LEADERBOARD.encode(image)
+
+
+# noinspection PyTypeChecker
+def level_card(
+    data: tuple[str, int, int, int, int, int, str, bytes]
+) -> tuple[bytes, str]:
+
+    name_text, xp, needed_xp, level, rank, template, avatar_key, avatar_bytes = data
+
+    with templates.level_card(template).copy() as image:
+
+        draw = ImageDraw.Draw(im=image)
+
+        with Image.open(fp=io.BytesIO(avatar_bytes)) as avatar:
+
+            avatar = avatar.resize(size=(256, 256), resample=Image.LANCZOS) if avatar.size != (256, 256) else avatar
+            image.paste(im=avatar, box=(22, 22), mask=avatar.convert("RGBA"))
+
+            if (colour := AVATAR_COLOURS.get(avatar_key)) is None:
+                colour = AVATAR_COLOURS[avatar_key] = palette.dominant_colour(avatar)
+
+        # Username
+
+        name_font = fonts.fit(name_text, path=fonts.KABEL_BLACK, size=56, bounds=(690, 45))
+
+        draw.text(xy=(300, 22 - name_font.getoffset(text=name_text)[1]), text=name_text, font=name_font, fill=colour)
+
+        # Level
+
+        level_text = f"Level: {level}"
+        level_font = fonts.font(fonts.KABEL_BLACK, 40)
+
+        draw.text(xy=(300, 72 - level_font.getoffset(text=level_text)[1]), text=level_text, font=level_font, fill="#1F1E1C")
+
+        # XP
+
+        xp_text = f"XP: {xp} / {xp + needed_xp}"
+        xp_font = fonts.font(fonts.KABEL_BLACK, 40)
+
+        draw.text(xy=(300, 112 - xp_font.getoffset(text=xp_text)[1]), text=xp_text, font=xp_font, fill="#1F1E1C")
+
+        # XP BAR
+
+        bar_len = 678
+        outline = utils.darken_colour(*colour, factor=0.2)
+
+        draw.rounded_rectangle(xy=((300, 152), (300 + bar_len, 192)), radius=10, outline=outline, fill="#1F1E1C", width=5)
+
+        if xp > 0:
+            filled_len = int(round(bar_len * xp / float(xp + needed_xp)))
+            draw.rounded_rectangle(xy=((300, 152), (300 + filled_len, 192)), radius=10, outline=outline, fill=colour, width=5)
+
+        # Rank
+
+        rank_text = f"#{rank}"
+        rank_font = fonts.font(fonts.KABEL_BLACK, 110)
+
+        draw.text(xy=(300, 202 - rank_font.getoffset(text=rank_text)[1]), text=rank_text, font=rank_font, fill="#1F1E1C")
+
+        #
+
+        return encoders.LEVEL_CARD.encode(image)
+
+
+# noinspection PyTypeChecker
+def _grid_page(groups: list[tuple[str, list[bytes]]], scale: float) -> tuple[bytes, str]:
+
+    def scaled(value: int) -> int:
+        return round(value * scale)
+
+    width_x, height_y = scaled(1600 * min(len(groups), GRID_COLUMNS) + 100), scaled(1800 * math.ceil(len(groups) / GRID_COLUMNS) + 100)
+    avatar_size = scaled(250)
+
+    # The background is opaque so there is no need for an alpha channel, which saves a quarter of the memory.
+    with Image.new(mode="RGB", size=(width_x, height_y), color=colours.MAIN.to_rgb()) as image:
+
+        draw = ImageDraw.Draw(im=image)
+        font = fonts.font(fonts.ARIAL, scaled(120))
+
+        for index, (name, avatars) in enumerate(groups):
+
+            x, y = scaled(100 + 1600 * (index % GRID_COLUMNS)), scaled(100 + 1800 * (index // GRID_COLUMNS))
+
+            draw.text(xy=(x, y), text=name, font=font, fill="#1B1A1C")
+
+            for position, avatar_bytes in enumerate(avatars):
+
+                with Image.open(fp=io.BytesIO(avatar_bytes)) as avatar:
+                    avatar = avatar.convert(mode="RGBA").resize(size=(avatar_size, avatar_size), resample=Image.LANCZOS)
+                    image.paste(im=avatar, box=(x + avatar_size * (position % 6), y + scaled(200) + avatar_size * (position // 6)), mask=avatar)
+
+        return encoders.GRID.encode(image)
+
+
+def grid(
+    data: dict[str, list[bytes]],
+    scale: float = GRID_SCALE,
+    rows_per_page: int = GRID_ROWS_PER_PAGE,
+) -> list[tuple[bytes, str]]:
+    """
+    Renders groups of avatars (e.g. people per timezone) in a grid, ``GRID_COLUMNS`` groups wide. The grid is split into
+    pages of ``rows_per_page`` rows, each its own image, so that only one page canvas is drawn at a time (the encoded
+    pages are all returned together), and drawn at ``scale`` times the full size of 1600x1800 pixels per group.
+    """
+
+    groups = list(data.items())
+    per_page = GRID_COLUMNS * rows_per_page
+
+    return [_grid_page(groups[start:start + per_page], scale) for start in range(0, len(groups), per_page)]
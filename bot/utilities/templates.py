@@ -0,0 +1,80 @@
+# Future
+from __future__ import annotations
+
+# Standard Library
+import functools
+import logging
+import pathlib
+
+# Packages
+from PIL import Image, ImageDraw
+
+# My stuff
+from utilities import fonts
+
+
+__log__: logging.Logger = logging.getLogger("utilities.templates")
+
+IMAGES = {
+    "SAI": {
+        "level_cards": [
+            pathlib.Path("./resources/SAI/level_cards/1.png"),
+            pathlib.Path("./resources/SAI/level_cards/2.png"),
+            pathlib.Path("./resources/SAI/level_cards/3.png"),
+            pathlib.Path("./resources/SAI/level_cards/4.png"),
+            pathlib.Path("./resources/SAI/level_cards/5.png"),
+            pathlib.Path("./resources/SAI/level_cards/6.png"),
+            pathlib.Path("./resources/SAI/level_cards/7.png"),
+            pathlib.Path("./resources/SAI/level_cards/8.png"),
+            pathlib.Path("./resources/SAI/level_cards/9.png"),
+        ],
+        "leaderboard": [
+            pathlib.Path("./resources/SAI/leaderboard/1.png"),
+            pathlib.Path("./resources/SAI/leaderboard/2.png"),
+            pathlib.Path("./resources/SAI/leaderboard/3.png"),
+            pathlib.Path("./resources/SAI/leaderboard/4.png"),
+            pathlib.Path("./resources/SAI/leaderboard/5.png"),
+            pathlib.Path("./resources/SAI/leaderboard/6.png"),
+        ],
+    }
+}
+
+
+def _decode(path: pathlib.Path) -> Image.Image:
+
+    with Image.open(fp=path) as image:
+        image.load()
+        return image.copy()
+
+
+@functools.lru_cache(maxsize=None)
+def level_card(index: int) -> Image.Image:
+    return _decode(IMAGES["SAI"]["level_cards"][index])
+
+
+# noinspection PyTypeChecker
+@functools.lru_cache(maxsize=None)
+def leaderboard(index: int) -> Image.Image:
+
+    image = _decode(IMAGES["SAI"]["leaderboard"][index])
+    draw = ImageDraw.Draw(im=image)
+
+    title_text = "XP Leaderboard:"
+    title_font = fonts.font(fonts.KABEL_BLACK, 93)
+    draw.text(xy=(10, 10 - title_font.getoffset(text=title_text)[1]), text=title_text, font=title_font, fill="#1F1E1C")
+
+    return image
+
+
+def preload() -> None:
+    """
+    Decodes every template (and draws their static text) up front so that renders only have to copy them.
+    """
+
+    try:
+        for index in range(len(IMAGES["SAI"]["level_cards"])):
+            level_card(index)
+        for index in range(len(IMAGES["SAI"]["leaderboard"])):
+            leaderboard(index)
+    except OSError as error:
+        __log__.warning(f"[TEMPLATES] Could not preload templates, they will be loaded when first rendered instead. {error}")
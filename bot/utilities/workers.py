@@ -0,0 +1,303 @@
+# Future
+from __future__ import annotations
+
+# Standard Library
+import asyncio
+import concurrent.futures
+import concurrent.futures.process
+import functools
+import logging
+import multiprocessing
+import time
+from collections.abc import Callable
+from multiprocessing import shared_memory
+from typing import Any, TypeVar
+
+# Packages
+import psutil
+
+
+__log__: logging.Logger = logging.getLogger("utilities.workers")
+
+T = TypeVar("T")
+
+
+def _warm() -> None:
+    # Submitted once per worker when the pool starts so that every worker is spawned and has run the pools
+    # initializer before the first real job arrives.
+    time.sleep(0.1)
+
+
+# Jobs run by this worker process so far, used to decide when it should be recycled.
+_jobs: int = 0
+
+
+def _run_job(
+    function: Callable[..., T],
+    args: tuple[Any, ...],
+    max_jobs: int | None,
+    max_memory: int | None
+) -> tuple[T, bool]:
+    # Runs in the worker. Along with the result it reports whether this worker has done enough jobs, or grown large
+    # enough, that the pool should be replaced with fresh workers.
+
+    global _jobs
+
+    result = function(*args)
+    _jobs += 1
+
+    recycle = (max_jobs is not None and _jobs >= max_jobs) or (max_memory is not None and psutil.Process().memory_info().rss >= max_memory)
+    return result, recycle
+
+
+def _release_abandoned(release: Callable[[Any], Any], job: concurrent.futures.Future[tuple[Any, bool]]) -> None:
+
+    if job.cancelled() or job.exception() is not None:
+        return
+
+    try:
+        release(job.result()[0])
+    except Exception as error:
+        __log__.warning("[WORKERS] Failed to release the result of a job that timed out.", exc_info=error)
+
+
+class WorkerStats:
+
+    def __init__(self) -> None:
+
+        self.pending: int = 0
+        self.completed: int = 0
+        self.failed: int = 0
+        self.timed_out: int = 0
+        self.restarts: int = 0
+        self.total_time: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"<WorkerStats pending={self.pending}, completed={self.completed}, failed={self.failed}, timed_out={self.timed_out}, restarts={self.restarts}>"
+
+    @property
+    def average_time(self) -> float:
+
+        if not (total := self.completed + self.failed + self.timed_out):
+            return 0.0
+
+        return self.total_time / total
+
+
+class SharedBuffer:
+
+    def __init__(self, memory: shared_memory.SharedMemory, size: int) -> None:
+
+        self.memory: shared_memory.SharedMemory = memory
+        # Shared memory is allocated in whole pages, so the segment can be larger than the data in it.
+        self.size: int = size
+
+    def __repr__(self) -> str:
+        return f"<SharedBuffer name='{self.memory.name}', size={self.size}>"
+
+    def __enter__(self) -> SharedBuffer:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    @classmethod
+    def create(cls, data: bytes) -> SharedBuffer:
+        """
+        Copies ``data`` into a new shared memory segment. Whoever ends up with the segment last has to ``unlink`` it.
+        """
+
+        memory = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+
+        assert memory.buf is not None
+        memory.buf[:len(data)] = data
+
+        return cls(memory, len(data))
+
+    @classmethod
+    def attach(cls, descriptor: tuple[str, int]) -> SharedBuffer:
+        name, size = descriptor
+        return cls(shared_memory.SharedMemory(name=name), size)
+
+    @property
+    def descriptor(self) -> tuple[str, int]:
+        # Small enough to send to or from a worker in place of the data itself.
+        return self.memory.name, self.size
+
+    def read(self) -> bytes:
+
+        assert self.memory.buf is not None
+        return bytes(self.memory.buf[:self.size])
+
+    def close(self) -> None:
+        self.memory.close()
+
+    def unlink(self) -> None:
+        self.memory.unlink()
+
+
+class WorkerPool:
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        max_workers: int,
+        timeout: float | None = None,
+        initializer: Callable[[], Any] | None = None,
+        max_jobs: int | None = None,
+        max_memory: int | None = None,
+    ) -> None:
+
+        self.name: str = name
+        self.max_workers: int = max_workers
+        self.timeout: float | None = timeout
+        self.initializer: Callable[[], Any] | None = initializer
+        self.max_jobs: int | None = max_jobs
+        self.max_memory: int | None = max_memory
+
+        self._executor: concurrent.futures.ProcessPoolExecutor | None = None
+
+        self.stats: WorkerStats = WorkerStats()
+
+    def __repr__(self) -> str:
+        return f"<WorkerPool name='{self.name}', max_workers={self.max_workers}, timeout={self.timeout}, queue_depth={self.queue_depth}>"
+
+    # Properties
+
+    @property
+    def queue_depth(self) -> int:
+        # Jobs that are waiting for a free worker, rather than being worked on.
+        return max(self.stats.pending - self.max_workers, 0)
+
+    # Lifecycle
+
+    def _create_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        # Workers are spawned rather than forked, forking the bot would copy its event loop, sockets and threads into
+        # every worker.
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=self.initializer,
+        )
+
+    def _warm_workers(self, executor: concurrent.futures.ProcessPoolExecutor) -> list[asyncio.Future[None]]:
+        loop = asyncio.get_running_loop()
+        return [loop.run_in_executor(executor, _warm) for _ in range(self.max_workers)]
+
+    def _log_warm_failure(self, future: asyncio.Future[None]) -> None:
+
+        if future.cancelled() or (exception := future.exception()) is None:
+            return
+
+        __log__.warning(f"[WORKERS] Failed to warm a restarted '{self.name}' worker.", exc_info=exception)
+
+    async def start(self) -> None:
+
+        if self._executor is not None:
+            return
+
+        start = time.perf_counter()
+        self._executor = self._create_executor()
+
+        await asyncio.gather(*self._warm_workers(self._executor))
+
+        __log__.info(f"[WORKERS] Started {self.max_workers} '{self.name}' workers in {(time.perf_counter() - start) * 1000:.2f}ms.")
+
+    def shutdown(self) -> None:
+
+        if self._executor is None:
+            return
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    def _restart(self, executor: concurrent.futures.ProcessPoolExecutor, *, reason: str, kill_after: float | None = None) -> None:
+
+        # Several jobs can ask for the same executor to be replaced (e.g. every job that was running when a worker
+        # crashed), only the first one does anything.
+        if executor is not self._executor:
+            return
+
+        self._executor = self._create_executor()
+        self.stats.restarts += 1
+
+        # Nothing waits on these, the next job just queues behind them, so failures are logged here instead of being
+        # reported as "exception was never retrieved".
+        for future in self._warm_workers(self._executor):
+            future.add_done_callback(self._log_warm_failure)
+
+        # The old executor is left to finish the jobs it was already given, new jobs go to the new one. When a job has
+        # hung, its worker is killed once any other job still running alongside it would have timed out too.
+        processes = list((executor._processes or {}).values())  # type: ignore
+        executor.shutdown(wait=False)
+
+        if kill_after is not None:
+            asyncio.get_running_loop().call_later(kill_after, self._kill, processes)
+
+        __log__.info(f"[WORKERS] Restarted '{self.name}' workers, reason: {reason}.")
+
+    @staticmethod
+    def _kill(processes: list[multiprocessing.Process]) -> None:
+
+        for process in processes:
+            if process.is_alive():
+                process.kill()
+
+    # Jobs
+
+    async def run(
+        self,
+        function: Callable[..., T],
+        *args: Any,
+        timeout: float | None = None,
+        release: Callable[[T], Any] | None = None
+    ) -> T:
+        """
+        Runs ``function`` with ``args`` in a worker process. Both have to be picklable, so jobs should take and return
+        plain data (str, int, bytes) rather than discord objects. Large payloads should be passed as ``SharedBuffer``
+        descriptors instead of bytes, so that they aren't pickled and copied through the pool.
+
+        A job that times out can still finish before its worker is killed. If it does, its result is passed to
+        ``release`` (e.g. to unlink the shared memory it returned), since nothing else will ever see it.
+        """
+
+        if self._executor is None:
+            await self.start()
+
+        executor = self._executor
+        assert executor is not None
+
+        self.stats.pending += 1
+        start = time.perf_counter()
+
+        # The result is awaited through the executors future rather than a thread blocking on the worker, and a job
+        # that times out has its worker killed so that it can't hold onto it forever.
+        timeout = timeout or self.timeout
+
+        try:
+            # Submitting to an executor whose worker has already died raises BrokenProcessPool too.
+            job = executor.submit(_run_job, function, args, self.max_jobs, self.max_memory)
+            result, recycle = await asyncio.wait_for(asyncio.wrap_future(job), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.stats.timed_out += 1
+            if not job.cancel() and release is not None:
+                job.add_done_callback(functools.partial(_release_abandoned, release))
+            self._restart(executor, reason="job timed out", kill_after=timeout)
+            raise
+        except concurrent.futures.process.BrokenProcessPool:
+            # A worker died (e.g. segfaulted on a bad input), which fails every job the executor had.
+            self.stats.failed += 1
+            self._restart(executor, reason="worker crashed")
+            raise
+        except Exception:
+            self.stats.failed += 1
+            raise
+        else:
+            self.stats.completed += 1
+            if recycle:
+                self._restart(executor, reason="worker reached its job or memory limit")
+            return result
+        finally:
+            self.stats.pending -= 1
+            self.stats.total_time += time.perf_counter() - start